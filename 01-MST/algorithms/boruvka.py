@@ -0,0 +1,104 @@
+import numpy as np
+
+from datastructure.csr_graph import AnyGraph
+from datastructure.graph import Graph
+
+
+def boruvka(graph: AnyGraph) -> Graph:
+    """
+    Returns the Minimum Spanning Tree of the given graph using Borůvka's algorithm.
+    Every round selects the cheapest edge leaving each component and merges the components
+    along the selected edges; each round is a constant number of whole-array operations on
+    the edge columns, and at most log2(n) rounds are needed since every round at least
+    halves the number of components.
+
+    Parameters
+    ----------
+    graph : AnyGraph
+        the graph on which calculate the Minimum Spanning Tree (Graph or CSRGraph)
+
+    Returns
+    -------
+    Graph :
+        Minimum Spanning Tree graph based on the input graph
+    """
+    mst: Graph = Graph()
+
+    heads, tails, weights = graph.get_edge_columns()
+
+    # sort the edges once: the position of an edge is then a rank that breaks the ties
+    # between equal weights, and filtering keeps the edges sorted
+    order = np.argsort(weights, kind="stable")
+    heads, tails, weights = heads[order], tails[order], weights[order]
+
+    # component of each node, identified by one of its nodes
+    size: int = max(graph.get_all_nodes(), default=-1) + 1
+    component: np.ndarray = np.arange(size)
+
+    while True:
+        head_components = component[heads]
+        tail_components = component[tails]
+
+        # the edges inside a component will never be selected again
+        crossing = head_components != tail_components
+        heads, tails, weights = heads[crossing], tails[crossing], weights[crossing]
+        head_components, tail_components = head_components[crossing], tail_components[crossing]
+        if len(weights) == 0:
+            break
+
+        # cheapest edge leaving each component, as the minimum rank over its edges
+        ranks = np.arange(len(weights))
+        cheapest = np.full(size, len(weights))
+        np.minimum.at(cheapest, head_components, ranks)
+        np.minimum.at(cheapest, tail_components, ranks)
+
+        components = np.flatnonzero(cheapest < len(weights))
+        selected = cheapest[components]
+        component = merge_components(component, components,
+                                     head_components[selected], tail_components[selected])
+
+        selected = np.unique(selected)
+        for a, b, weight in zip(heads[selected].tolist(), tails[selected].tolist(), weights[selected].tolist()):
+            mst.add_edge(a, b, weight)
+
+    return mst
+
+
+def merge_components(component: np.ndarray, components: np.ndarray,
+                     head_components: np.ndarray, tail_components: np.ndarray) -> np.ndarray:
+    """
+    Merge the components along the cheapest edge selected by each of them
+
+    Parameters
+    ----------
+    component : np.ndarray
+        component of each node, identified by one of its nodes
+    components : np.ndarray
+        the components that selected an edge
+    head_components : np.ndarray
+        component of the first endpoint of the edge selected by each component
+    tail_components : np.ndarray
+        component of the second endpoint of the edge selected by each component
+
+    Returns
+    -------
+    np.ndarray
+        the component of each node after the merge
+    """
+    targets = np.where(head_components == components, tail_components, head_components)
+
+    # every component hooks to the one on the other side of its cheapest edge;
+    # two components that selected the same edge would point to each other,
+    # so the smaller one becomes the root
+    parent = np.arange(len(component))
+    parent[components] = targets
+    mutual = (parent[targets] == components) & (components < targets)
+    parent[components[mutual]] = components[mutual]
+
+    # pointer jumping until every node points to the root of its tree
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            break
+        parent = grandparent
+    return parent[component]
@@ -0,0 +1,92 @@
+import numpy as np
+
+from datastructure.csr_graph import AnyGraph
+from datastructure.graph import Graph
+from datastructure.union_find import UnionFindSet
+
+# Below this number of edges the partitioning is not worth it and the edges are just sorted
+BASE_CASE_SIZE = 1024
+
+
+def filter_kruskal(graph: AnyGraph) -> Graph:
+    """
+    Returns the Minimum Spanning Tree of the given graph using Filter-Kruskal:
+    the edges are partitioned around a pivot weight, the MST is computed on the light half
+    and the heavy edges whose endpoints are already in the same set are filtered out
+    before processing the rest, so most of the heavy edges are never sorted
+
+    Parameters
+    ----------
+    graph : AnyGraph
+        the graph on which calculate the Minimum Spanning Tree (Graph or CSRGraph)
+
+    Returns
+    -------
+    Graph :
+        Minimum Spanning Tree graph based on the input graph
+    """
+    mst: Graph = Graph()
+
+    nodes = graph.get_all_nodes()
+    union_find: UnionFindSet = UnionFindSet(max(nodes, default=-1) + 1)
+
+    heads, tails, weights = graph.get_edge_columns()
+    _filter_kruskal(heads, tails, weights, union_find, mst, len(nodes) - 1)
+
+    return mst
+
+
+def _filter_kruskal(heads: np.ndarray, tails: np.ndarray, weights: np.ndarray,
+                    union_find: UnionFindSet, mst: Graph, missing_edges: int) -> int:
+    """
+    Add to the MST the edges of the spanning forest of the given edges
+
+    Parameters
+    ----------
+    heads : np.ndarray
+        first endpoints of the edges
+    tails : np.ndarray
+        second endpoints of the edges
+    weights : np.ndarray
+        weights of the edges
+    union_find : UnionFindSet
+        the sets of nodes already connected by the MST
+    mst : Graph
+        the MST under construction
+    missing_edges : int
+        number of edges still missing to complete the spanning tree
+
+    Returns
+    -------
+    int
+        number of edges still missing to complete the spanning tree after the given edges
+    """
+    if missing_edges == 0 or len(weights) == 0:
+        return missing_edges
+
+    if len(weights) > BASE_CASE_SIZE:
+        # the median weight splits the edges in two halves
+        pivot = np.partition(weights, len(weights) // 2)[len(weights) // 2]
+        light = weights < pivot
+        if light.any():
+            missing_edges = _filter_kruskal(heads[light], tails[light], weights[light],
+                                            union_find, mst, missing_edges)
+            if missing_edges == 0:
+                return 0
+
+            # filter: a heavy edge inside a set would close a cycle
+            heavy = ~light
+            heads, tails, weights = heads[heavy], tails[heavy], weights[heavy]
+            crossing = union_find.find_all(heads) != union_find.find_all(tails)
+            return _filter_kruskal(heads[crossing], tails[crossing], weights[crossing],
+                                   union_find, mst, missing_edges)
+
+    # base case (or every edge has the pivot weight): plain Kruskal
+    order = np.argsort(weights, kind="stable")
+    for a, b, weight in zip(heads[order].tolist(), tails[order].tolist(), weights[order].tolist()):
+        if union_find.union(a, b):
+            mst.add_edge(a, b, weight)
+            missing_edges -= 1
+            if missing_edges == 0:
+                break
+    return missing_edges
@@ -1,36 +1,53 @@
-from datastructure.graph import Graph, Edges
-from datastructure.union_find import UnionFindSet
+from typing import Iterator, Optional, Tuple, Union
 
+from datastructure.csr_graph import AnyGraph
+from datastructure.graph import Graph
+from datastructure.spanning_tree import MST, TreeBuilder
+from datastructure.union_find import ProfiledUnionFindSet, UnionFindSet
+from profiler import ProfileStats, active
 
-def kruskal_union_find(graph: Graph) -> Graph:
+
+def kruskal_union_find(graph: AnyGraph, as_graph: bool = True) -> MST:
     """
     Returns the Minimum Spanning Tree of the given graph using Kruskal with
     Union Find (based on union-by-size)
 
     Parameters
     ----------
-    graph : Graph
-        the graph on which calculate the Minimum Spanning Tree
+    graph : AnyGraph
+        the graph on which calculate the Minimum Spanning Tree (Graph or CSRGraph)
+    as_graph : bool
+        if False the accepted edges are only collected in arrays and returned as a
+        SpanningTree, without building a Graph
 
     Returns
     -------
-    Graph :
+    MST :
         Minimum Spanning Tree graph based on the input graph
     """
-    mst: Graph = Graph()
-    union_find: UnionFindSet = UnionFindSet()
-
-    # Create all the initial sets of union-find
-    for node in graph.get_all_nodes():
-        union_find.make(node)
-
-    # Sort the edges of the graph
-    edges: Edges = graph.get_sorted_edges()
-
-    # Check if an edge is not inside another set, then make the union of the sets
-    # and add that edge to the MST
-    for edge, weight in edges.items():
-        if union_find.find(edge[0]) != union_find.find(edge[1]):
-            mst.add_edge(edge[0], edge[1], weight)
-            union_find.union(edge[0], edge[1])
-    return mst
+    mst: Union[Graph, TreeBuilder] = Graph() if as_graph else TreeBuilder()
+    # the profiled variants are used only inside a profiler.profile block
+    stats: Optional[ProfileStats] = active()
+
+    # Create all the initial sets of union-find, one for each node id
+    size: int = max(graph.get_all_nodes(), default=-1) + 1
+    union_find: UnionFindSet = UnionFindSet(size) if stats is None else ProfiledUnionFindSet(size, stats)
+
+    # a spanning tree has n - 1 edges, once found the remaining edges can't be part of it
+    tree_edges: int = len(graph.get_all_nodes()) - 1
+    accepted_edges: int = 0
+
+    # Check if an edge (in crescent order of weight) is not inside another set,
+    # then make the union of the sets and add that edge to the MST.
+    # The edges are sorted lazily, the ones after the last accepted edge are never sorted
+    edges: Iterator[Tuple[int, int, int]] = graph.iter_sorted_edges(lazy=True)
+    if stats is not None:
+        edges = stats.timed_iter("sort", edges)
+
+    for a, b, weight in edges:
+        if union_find.union(a, b):
+            mst.add_edge(a, b, weight)
+            accepted_edges += 1
+            if accepted_edges == tree_edges:
+                break
+    return mst if as_graph else mst.build()
@@ -1,31 +1,133 @@
-from datastructure.graph import Graph, Edges
+from functools import partial
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 
+from datastructure.csr_graph import AnyGraph
+from datastructure.graph import Graph
+from datastructure.spanning_tree import MST, TreeBuilder, tree_from_columns
+from profiler import ProfileStats, active
 
-def naive_kruskal(graph: Graph) -> Graph:
+
+def naive_kruskal(graph: AnyGraph, forest_check: bool = False, stop_early: bool = False,
+                  as_graph: bool = True) -> MST:
     """
     Returns the Minimum Spanning Tree of the given graph using Naive Kruskal Algorithm
 
     Parameters
     ----------
-    graph : Graph
-        the graph on which calculate the Minimum Spanning Tree
+    graph : AnyGraph
+        the graph on which calculate the Minimum Spanning Tree (Graph or CSRGraph)
+    forest_check : bool
+        if True, instead of adding the edge and looking for a cycle with a BFS on the
+        MST graph, check with a DFS bounded to the tree of the first endpoint whether the
+        second endpoint is already reachable in the growing forest
+    stop_early : bool
+        if True, stop as soon as n - 1 edges have been accepted
+    as_graph : bool
+        if False the tree is returned as a SpanningTree. With forest_check no Graph is
+        built at all, otherwise the BFS still needs the MST graph
 
     Returns
     -------
-    Graph :
+    MST :
         Minimum Spanning Tree graph based on the input graph
     """
     # empty graph to return with the solution
     mst_graph: Graph = Graph()
+    # with forest_check the cycles are found on the forest, so the edges can go in arrays
+    mst: Union[Graph, TreeBuilder] = TreeBuilder() if forest_check and not as_graph else mst_graph
+
+    nodes = graph.get_all_nodes()
+    # number of edges of a spanning tree, the algorithm can stop once reached
+    tree_edges: int = len(nodes) - 1 if stop_early else -1
+    accepted_edges: int = 0
+
+    if forest_check:
+        # adjacency of the growing forest, indexed by node name
+        forest: List[List[int]] = [[] for _ in range(max(nodes, default=-1) + 1)]
+
+    edges: Iterator[Tuple[int, int, int]] = graph.iter_sorted_edges()
+    is_reachable: Callable[[List[List[int]], int, int], bool] = _is_reachable
+    is_cyclic: Callable[[int], bool] = mst_graph.is_cyclic
+
+    # inside a profiler.profile block, time the sort and the cycle checks and count the visited nodes
+    stats: Optional[ProfileStats] = active()
+    if stats is not None:
+        edges = stats.timed_iter("sort", edges)
+        is_reachable = stats.timed("cycle_check", partial(_is_reachable_profiled, stats=stats))
+        is_cyclic = stats.timed("cycle_check", partial(mst_graph.is_cyclic, stats=stats))
 
-    # sorting the edges in crescent order
-    edges: Edges = graph.get_sorted_edges()
+    # check for all the edges sorted in crescent order
+    for a, b, weight in edges:
+        if accepted_edges == tree_edges:
+            break
+
+        if forest_check:
+            # the edge would close a cycle only if b is already reachable from a
+            if not is_reachable(forest, a, b):
+                forest[a].append(b)
+                forest[b].append(a)
+                mst.add_edge(a, b, weight)
+                accepted_edges += 1
+            continue
 
-    # check for all the edges sorted the nodes
-    for edge, weight in edges.items():
         # add in the new graph if the graph created is still acyclic,
         # else continue with the next nodes
-        mst_graph.add_edge(edge[0], edge[1], weight)
-        if mst_graph.is_cyclic(edge[0]):
-            mst_graph.remove_edge(edge[0], edge[1])
-    return mst_graph
+        mst_graph.add_edge(a, b, weight)
+        if is_cyclic(a):
+            mst_graph.remove_edge(a, b)
+        else:
+            accepted_edges += 1
+
+    if as_graph:
+        return mst_graph
+    if forest_check:
+        return mst.build()
+    return tree_from_columns(*mst_graph.get_edge_columns())
+
+
+def _is_reachable(forest: List[List[int]], source: int, target: int) -> bool:
+    """
+    Returns true if target is reachable from source in the given forest.
+    Since there are no cycles, it is enough to remember the node each one has been
+    reached from, and the visit never leaves the tree of source.
+
+    Parameters
+    ----------
+    forest : List[List[int]]
+        adjacency of the forest, indexed by node name
+    source : int
+        the node on which start the visit
+    target : int
+        the node to look for
+
+    Returns
+    -------
+    bool
+        if target is reachable from source or not
+    """
+    stack: List[Tuple[int, int]] = [(source, -1)]
+    while stack:
+        node, previous = stack.pop()
+        if node == target:
+            return True
+        for adjacency_node in forest[node]:
+            if adjacency_node != previous:
+                stack.append((adjacency_node, node))
+    return False
+
+
+def _is_reachable_profiled(forest: List[List[int]], source: int, target: int, stats: ProfileStats) -> bool:
+    # _is_reachable counting the visited nodes
+    visits: int = 0
+    stack: List[Tuple[int, int]] = [(source, -1)]
+    while stack:
+        node, previous = stack.pop()
+        visits += 1
+        if node == target:
+            stats.count("cycle_check_visits", visits)
+            return True
+        for adjacency_node in forest[node]:
+            if adjacency_node != previous:
+                stack.append((adjacency_node, node))
+    stats.count("cycle_check_visits", visits)
+    return False
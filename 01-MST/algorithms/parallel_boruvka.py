@@ -0,0 +1,168 @@
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from algorithms.boruvka import merge_components
+from datastructure.graph import Graph
+from parser import ColumnContent
+
+# Views on the shared memory blocks, set in every worker by _attach
+_shared: Dict[str, np.ndarray] = {}
+_blocks: List[SharedMemory] = []
+
+
+def parallel_boruvka(content: ColumnContent, processes: Optional[int] = None) -> Graph:
+    """
+    Returns the Minimum Spanning Tree of the graph described by the given edge columns
+    using Borůvka's algorithm on a pool of processes.
+    The edges are sorted once and split in one shard per process; the edges and the current
+    component of each node live in shared memory, so nothing but the shard boundaries is sent
+    to the workers. In every round each worker drops the edges of its shard that are inside
+    a component and returns the cheapest edge leaving each component among the remaining ones,
+    as (component, rank) pairs, then the parent reduces them and merges the components.
+
+    Parameters
+    ----------
+    content : ColumnContent
+        the edges of the graph, as returned by parser.load_columns
+    processes : Optional[int]
+        number of worker processes, by default the number of CPUs
+
+    Returns
+    -------
+    Graph :
+        Minimum Spanning Tree graph based on the input edges
+    """
+    mst: Graph = Graph()
+    processes = processes or os.cpu_count() or 1
+
+    # sort the edges once: the position of an edge is then a rank that breaks the ties
+    order = np.argsort(content.weights, kind="stable")
+    heads = np.asarray(content.sources)[order]
+    tails = np.asarray(content.targets)[order]
+    weights = np.asarray(content.weights)[order]
+
+    m: int = len(weights)
+    if m == 0:
+        return mst
+    size: int = int(max(heads.max(), tails.max())) + 1
+    bounds: List[int] = np.linspace(0, m, processes + 1, dtype=int).tolist()
+    shards: List[Tuple[int, int, int]] = [(shard, bounds[shard], bounds[shard + 1] - bounds[shard])
+                                          for shard in range(processes)]
+
+    blocks: Dict[str, SharedMemory] = {}
+    shared: Dict[str, np.ndarray] = {}
+    try:
+        for name, shape, dtype in (("heads", (m,), np.int32), ("tails", (m,), np.int32),
+                                   ("ranks", (m,), np.int64), ("component", (size,), np.int64)):
+            blocks[name] = SharedMemory(create=True, size=max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1))
+            shared[name] = np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf)
+        shared["heads"][:] = heads
+        shared["tails"][:] = tails
+        shared["ranks"][:] = np.arange(m)
+
+        component: np.ndarray = np.arange(size)
+        layout = {name: (block.name, shared[name].shape, shared[name].dtype.str) for name, block in blocks.items()}
+
+        with Pool(processes, initializer=_attach, initargs=(layout,)) as pool:
+            while True:
+                shared["component"][:] = component
+                results = pool.map(_cheapest_edges, shards)
+                shards = [(shard, start, length) for (shard, start, _), (length, _, _) in zip(shards, results)]
+
+                # the cheapest edge leaving each component among the ones of all the shards
+                cheapest = np.full(size, m, dtype=np.int64)
+                for _, shard_components, shard_ranks in results:
+                    np.minimum.at(cheapest, shard_components, shard_ranks)
+                components = np.flatnonzero(cheapest < m)
+                if len(components) == 0:
+                    break
+
+                selected = cheapest[components]
+                component = merge_components(component, components,
+                                             component[heads[selected]], component[tails[selected]])
+
+                selected = np.unique(selected)
+                for a, b, weight in zip(heads[selected].tolist(), tails[selected].tolist(),
+                                        weights[selected].tolist()):
+                    mst.add_edge(a, b, weight)
+
+            # let the workers exit by themselves, so they detach from the blocks (see _attach)
+            pool.close()
+            pool.join()
+    finally:
+        # the views must be released before closing the blocks
+        shared.clear()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+    return mst
+
+
+def _attach(layout: Dict[str, Tuple[str, tuple, str]]) -> None:
+    """
+    Pool initializer: attach the worker to the shared memory blocks
+
+    Parameters
+    ----------
+    layout : Dict[str, Tuple[str, tuple, str]]
+        name of the block, shape and dtype of each shared array
+    """
+    for name, (block_name, shape, dtype) in layout.items():
+        block = SharedMemory(name=block_name)
+        _blocks.append(block)
+        _shared[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    # run when the worker exits
+    Finalize(None, _detach, exitpriority=0)
+
+
+def _detach() -> None:
+    # the views must be released before closing the blocks
+    _shared.clear()
+    for block in _blocks:
+        block.close()
+    _blocks.clear()
+
+
+def _cheapest_edges(shard: Tuple[int, int, int]) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Compact the given shard dropping the edges inside a component and find the rank of
+    the cheapest remaining edge leaving each component
+
+    Parameters
+    ----------
+    shard : Tuple[int, int, int]
+        index of the shard, start and number of edges still in the shard
+
+    Returns
+    -------
+    Tuple[int, np.ndarray, np.ndarray]
+        number of edges still in the shard after the compaction, the components with an edge
+        leaving them and the rank of their cheapest one
+    """
+    _, start, length = shard
+    component = _shared["component"]
+    heads = _shared["heads"][start:start + length]
+    tails = _shared["tails"][start:start + length]
+    ranks = _shared["ranks"][start:start + length]
+
+    head_components = component[heads]
+    tail_components = component[tails]
+    crossing = head_components != tail_components
+    length = int(crossing.sum())
+
+    # the order of the edges (and so of the ranks) is kept by the compaction
+    heads[:length] = heads[crossing]
+    tails[:length] = tails[crossing]
+    ranks[:length] = ranks[crossing]
+
+    # the ranks are increasing, so the first edge of a component is its cheapest
+    endpoints = np.stack((head_components[crossing], tail_components[crossing]), axis=1).ravel()
+    components, first = np.unique(endpoints, return_index=True)
+
+    return length, components, ranks[first // 2]
@@ -1,41 +1,115 @@
+from heapq import heappop, heappush
+from typing import Iterator, List, Optional, Tuple, Union
+
+from datastructure.csr_graph import AnyGraph
 from datastructure.graph import Graph
-from datastructure.heap import Heap, HeapNode
+from datastructure.heap import Heap, ProfiledHeap
+from datastructure.spanning_tree import MST, TreeBuilder
+from profiler import ProfileStats, active, phase
 
 
-def prim(graph: Graph, starting_node: int = 1) -> Graph:
+def prim(graph: AnyGraph, starting_node: int = 1, lazy: bool = False, as_graph: bool = True) -> MST:
     """
     Returns the MST of the inout graph
     Parameters
     ----------
-    graph : Graph
-        the input graph
+    graph : AnyGraph
+        the input graph (Graph or CSRGraph)
     starting_node : int
         Prim require a starting node
+    lazy : bool
+        if True use prim_lazy (heapq with lazy deletion) instead of the
+        decrease-key indexed heap, usually faster on sparse graphs
+    as_graph : bool
+        if False the tree is returned as a SpanningTree, built from the parents
+        in the heap without creating a Graph
 
     Returns
     -------
-    Graph
+    MST
         minimum spanning tree graph of the input graph
     """
-    heap: Heap = Heap()
-    heap.init_nodes(graph, starting_node)
+    if lazy:
+        return prim_lazy(graph, starting_node, as_graph)
+
+    # the profiled heap is used only inside a profiler.profile block
+    stats: Optional[ProfileStats] = active()
+    heap: Heap = Heap() if stats is None else ProfiledHeap(stats)
+    with phase(stats, "init"):
+        heap.init_nodes(graph, starting_node)
 
     while not heap.is_empty():
 
         # since we are using a Heap, pop() always returns the minimum node (based on the key)
-        min_node: HeapNode = heap.pop()
+        min_node: int = heap.pop()
+
+        for adjacency_node, candidate_weight in graph.iter_node_edges(min_node):
+
+            # the key of the adjacency node, None if it is not in the heap anymore
+            adjacency_key = heap.get_by_name(adjacency_node)
+
+            # we update adjacency_node's key only if we found a better weight
+            if adjacency_key is not None and candidate_weight < adjacency_key:
+                heap.parents[adjacency_node] = min_node
+                heap.update(heap.indexes[adjacency_node], candidate_weight)
+
+    with phase(stats, "build_graph"):
+        return heap.build_graph() if as_graph else heap.build_tree()
+
+
+def prim_lazy(graph: AnyGraph, starting_node: int = 1, as_graph: bool = True) -> MST:
+    """
+    Returns the MST of the input graph using Prim with lazy deletion: instead of
+    decreasing the key of a node, a new (weight, node, parent) entry is pushed in a heapq
+    and the stale entries of nodes already in the tree are skipped when popped.
+    When the component of the starting node is spanned it restarts from the next node not
+    reached yet, so on a disconnected graph it returns the spanning forest, like prim
+    Parameters
+    ----------
+    graph : AnyGraph
+        the input graph (Graph or CSRGraph)
+    starting_node : int
+        Prim require a starting node, if it is not in the graph the first node is used
+    as_graph : bool
+        if False the tree is returned as a SpanningTree instead of a Graph
+
+    Returns
+    -------
+    MST
+        minimum spanning tree graph of the input graph
+    """
+    mst: Union[Graph, TreeBuilder] = Graph() if as_graph else TreeBuilder()
+
+    nodes = graph.get_all_nodes()
+    # the names that are not nodes are never reached, as if they were already in the tree
+    in_tree: List[bool] = [True] * (max(nodes, default=-1) + 1)
+    for node in nodes:
+        in_tree[node] = False
+    remaining: int = len(nodes)
+
+    queue: List[Tuple[int, int, int]] = []
+    if 0 <= starting_node < len(in_tree):
+        queue.append((0, starting_node, -1))
+    roots: Iterator[int] = iter(nodes)
+
+    while remaining > 0:
+        if not queue:
+            # the component is spanned, restart from a node not reached yet
+            queue.append((0, next(root for root in roots if not in_tree[root]), -1))
 
-        for adjacency_node_name in graph.get_node_edges(min_node.name):
+        weight, node, parent = heappop(queue)
 
-            # from the node's name, we obtain the HeapNode object
-            adjacency_node = heap.get_by_name(adjacency_node_name)
+        # a stale entry: the node has already been reached with a lighter edge
+        if in_tree[node]:
+            continue
 
-            if adjacency_node is not None:
-                # we update adjacency_node's key only if we found a better weight
-                candidate_weight: int = graph.get_weight(min_node.name, adjacency_node.name)
+        in_tree[node] = True
+        remaining -= 1
+        if parent != -1:
+            mst.add_edge(parent, node, weight)
 
-                if candidate_weight < adjacency_node.key:
-                    adjacency_node.parent = min_node.name
-                    heap.update(heap.indexes[adjacency_node.name], candidate_weight)
+        for adjacency_node, candidate_weight in graph.iter_node_edges(node):
+            if not in_tree[adjacency_node]:
+                heappush(queue, (candidate_weight, adjacency_node, node))
 
-    return heap.build_graph()
+    return mst if as_graph else mst.build()
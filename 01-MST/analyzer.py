@@ -1,6 +1,9 @@
 import gc
 import math
+import multiprocessing
 import os
+import queue
+import statistics
 from dataclasses import dataclass
 from time import perf_counter_ns
 from typing import Callable, Dict, List, Optional, Tuple
@@ -9,15 +12,32 @@ import matplotlib.pyplot as plt
 from algorithms.kruskal_union_find import kruskal_union_find
 from algorithms.naive_kruskal import naive_kruskal
 from algorithms.prim import prim
+from benchmark import BenchmarkResult, Timing, save_results
 from datastructure.graph import Graph, graph_from_file
+from memory import MemoryUsage, measure_memory
 
-DATASET: List[str] = sorted(os.listdir("dataset"))
+# only the source files, not their binary caches
+DATASET: List[str] = sorted(file for file in os.listdir("dataset") if file.endswith(".txt"))
 
 # Type aliases
 Time = float
 DataGraph = Tuple[int, int]  # for represent only number of nodes and number of edges
 MSTAlgorithm = Callable[[Graph], Graph]
 ComplexityFunction = Callable[[Tuple[int, int]], Time]
+BenchmarkJob = Tuple[MSTAlgorithm, bool]  # an algorithm and if it is exponential
+
+# Adaptive timing: every sample lasts at least TARGET_SAMPLE_TIME, at least MIN_SAMPLES samples
+# are taken and then more until the 95% confidence interval of the mean is within RELATIVE_PRECISION
+# of it or the TIME_BUDGET of the measurement is spent. A single run over the TIME_BUDGET is
+# the only sample, as without adaptive timing (all the times are in ns)
+TARGET_SAMPLE_TIME: Time = 10 ** 7
+TIME_BUDGET: Time = 10 ** 9
+RELATIVE_PRECISION: float = 0.02
+MIN_SAMPLES: int = 5
+MAX_SAMPLES: int = 1000
+
+# Seconds a worker of measure_time_parallel waits for its CPU
+PIN_TIMEOUT: float = 1.0
 
 
 def mlogn(size: Tuple[int, int]) -> float:
@@ -40,13 +60,18 @@ class Analysis:
 
     time : Time
         a float representing the time of execution
+
+    results : List[BenchmarkResult]
+        the measures of every file with this number of nodes and edges
     """
     data: DataGraph
     time: Time
+    results: List[BenchmarkResult]
 
-    def __init__(self, data: Tuple[int, int], time: float):
+    def __init__(self, data: Tuple[int, int], time: float, results: Optional[List[BenchmarkResult]] = None):
         self.data = data
         self.time = time
+        self.results = results if results is not None else []
 
 
 def run_algorithm(graph: Graph, algorithm: MSTAlgorithm, num_calls: int) -> Time:
@@ -80,39 +105,125 @@ def run_algorithm(graph: Graph, algorithm: MSTAlgorithm, num_calls: int) -> Time
     return (end_time - start_time) / num_calls
 
 
-def measure_time(algorithm: MSTAlgorithm, num_calls: int,
-                 is_exponential: bool = False) -> List[Analysis]:
+def autorange(graph: Graph, algorithm: MSTAlgorithm) -> Tuple[int, List[Time]]:
     """
-    Execute the given MST-algorithm, over all the graphs in the DATASET directory for
-    the given number of calls and return a sorted list of the graph and the average
-    time of execution of the algorithm.
+    Find the number of calls needed for a sample to last at least TARGET_SAMPLE_TIME,
+    trying 1, 2, 5, 10, 20, 50, ... calls like timeit.autorange
 
     Parameters
     ----------
+    graph : graph
+        is the graph in which the algorithm will be executed
     algorithm : MSTAlgorithm
         is the algorithm to execute
-    num_calls : int
-        number of calls that must be make
-    is_exponential : bool
-        Indicate if the algorithm is exponential
+
     Returns
     -------
-    A list composed by the data of the graphs and its average time of execution of the algorithm.
+    The number of calls of a sample and the average time of a call in every try, that
+    are the warmup of the measure.
 
     """
+    warmup: List[Time] = []
+    num_calls: int = 1
+    while True:
+        for factor in (1, 2, 5):
+            calls: int = num_calls * factor
+            warmup.append(run_algorithm(graph, algorithm, calls))
+            if warmup[-1] * calls >= TARGET_SAMPLE_TIME:
+                return calls, warmup
+        num_calls *= 10
+
+
+def run_algorithm_adaptive(graph: Graph, algorithm: MSTAlgorithm, time_budget: Time = TIME_BUDGET,
+                           relative_precision: float = RELATIVE_PRECISION) -> Timing:
+    """
+    Execute the given MST-algorithm over the given graph choosing the number of calls
+    by itself: the calls of a sample are found by autorange, then MIN_SAMPLES samples are taken
+    and more until the 95% confidence interval of the mean is tight enough or the time budget is spent.
+    If a single run lasts more than the time budget (e.g. naive Kruskal on the biggest graphs)
+    no more runs are done, the slow run is the only sample.
 
-    # Dict where to store the data of the graphs and the average times of every execution
-    times: Dict[DataGraph, List[Time]] = {}
-    # Dict where to store the data of the grpahs and the average of avrage times
-    avg_times: Dict[DataGraph, Time] = {}
+    Parameters
+    ----------
+    graph : graph
+        is the graph in which the algorithm will be executed
+    algorithm : MSTAlgorithm
+        is the algorithm to execute
+    time_budget : Time
+        time after which no more samples are taken, once there are MIN_SAMPLES
+        or a single run took longer (ns)
+    relative_precision : float
+        half width of the confidence interval, relative to the mean, at which to stop
 
-    # Executing the algorithm over all the graphs inside the DATASET
-    for file_number, file in enumerate(DATASET):
+    Returns
+    -------
+    The samples, with the repetitions used and the warmup.
 
-        print(str(file_number + 1) + "/68")
+    """
+    repetitions, warmup = autorange(graph, algorithm)
+    if repetitions == 1 and warmup[-1] >= time_budget:
+        # the first run of autorange is already over the budget, it is the sample
+        return Timing(samples=warmup[-1:], repetitions=1)
+    samples: List[Time] = []
+
+    start_time = perf_counter_ns()
+    while len(samples) < MAX_SAMPLES:
+        samples.append(run_algorithm(graph, algorithm, repetitions))
 
-        graph: Graph = graph_from_file("dataset/" + file)
+        # the budget limits only the samples after the first MIN_SAMPLES, unless a run is over it
+        if samples[-1] >= time_budget:
+            break
+        if len(samples) >= MIN_SAMPLES:
+            if perf_counter_ns() - start_time >= time_budget:
+                break
+            half_width = 1.96 * statistics.stdev(samples) / math.sqrt(len(samples))
+            if half_width <= relative_precision * statistics.mean(samples):
+                break
 
+    return Timing(samples=samples, repetitions=repetitions, warmup=warmup)
+
+
+def measure_file(file: str, algorithm: MSTAlgorithm, num_calls: int,
+                 is_exponential: bool = False, adaptive: bool = False, memory: bool = False) -> BenchmarkResult:
+    """
+    Execute the given MST-algorithm over the graph in the given DATASET file, for a number
+    of calls that decreases with the size of the graph, and return the measured times.
+
+    Parameters
+    ----------
+    file : str
+        name of the file in the DATASET directory
+    algorithm : MSTAlgorithm
+        is the algorithm to execute
+    num_calls : int
+        number of calls that must be make on a graph of 2 nodes
+    is_exponential : bool
+        Indicate if the algorithm is exponential
+    adaptive : bool
+        Choose the number of calls with run_algorithm_adaptive instead
+    memory : bool
+        Measure also the memory used to load the graph (parsing the file, without the cache)
+        and by one more run of the algorithm, outside of the timed runs
+    Returns
+    -------
+    The data of the graph and the times of execution of the algorithm, a single sample
+    without warmup if not adaptive.
+
+    """
+    construction_memory: Optional[MemoryUsage] = None
+    if memory:
+        # parsed, not memory-mapped from the binary cache, so the construction is really measured
+        with measure_memory() as construction_memory:
+            graph: Graph = graph_from_file("dataset/" + file, use_cache=False)
+    else:
+        graph = graph_from_file("dataset/" + file)
+
+    if adaptive:
+        timing: Timing = run_algorithm_adaptive(graph, algorithm)
+        print("Running with: %d x %d samples, median %.2f ns, stddev %.2f ns, %d outliers"
+              % (timing.repetitions, len(timing.samples), timing.median, timing.stddev, timing.outliers))
+        print()
+    else:
         # num calls decreases depending on the graph node number ^ 2
         specific_num_calls = int(num_calls / (graph.n / 2)) + 1
 
@@ -126,14 +237,142 @@ def measure_time(algorithm: MSTAlgorithm, num_calls: int,
         print()
 
         estimate_time: Time = run_algorithm(graph, algorithm, specific_num_calls)
+        timing = Timing(samples=[estimate_time], repetitions=specific_num_calls)
+
+    run_memory: Optional[MemoryUsage] = None
+    if memory:
+        with measure_memory() as run_memory:
+            algorithm(graph)
+        print("Memory: construction %d B traced, run %d B traced, peak RSS %s B"
+              % (construction_memory.traced_peak, run_memory.traced_peak, run_memory.rss_peak))
+
+    return BenchmarkResult(file, algorithm.__name__, graph.n, graph.m, timing, construction_memory, run_memory)
 
-        # Create the data graph to use as key in the dict
-        data: DataGraph = (graph.n, graph.m)
 
+def measure_time(algorithm: MSTAlgorithm, num_calls: int,
+                 is_exponential: bool = False, adaptive: bool = False, memory: bool = False) -> List[Analysis]:
+    """
+    Execute the given MST-algorithm, over all the graphs in the DATASET directory for
+    the given number of calls and return a sorted list of the graph and the average
+    time of execution of the algorithm.
+
+    Parameters
+    ----------
+    algorithm : MSTAlgorithm
+        is the algorithm to execute
+    num_calls : int
+        number of calls that must be make
+    is_exponential : bool
+        Indicate if the algorithm is exponential
+    adaptive : bool
+        Choose the number of calls with run_algorithm_adaptive
+    memory : bool
+        Measure also the memory, see measure_file
+    Returns
+    -------
+    A list composed by the data of the graphs and its average time of execution of the algorithm.
+
+    """
+    measures: List[BenchmarkResult] = []
+
+    # Executing the algorithm over all the graphs inside the DATASET
+    for file_number, file in enumerate(DATASET):
+
+        print(str(file_number + 1) + "/" + str(len(DATASET)))
+
+        measures.append(measure_file(file, algorithm, num_calls, is_exponential, adaptive, memory))
+
+    return _group_times(measures)
+
+
+def measure_time_parallel(jobs: List[BenchmarkJob], num_calls: int, processes: Optional[int] = None,
+                          adaptive: bool = False, memory: bool = False) -> List[List[Analysis]]:
+    """
+    Execute every given MST-algorithm over all the graphs in the DATASET directory, like
+    measure_time, distributing the (file, algorithm) pairs over a pool of processes.
+    Every worker is pinned to its own CPU (when the platform allows it), so the jobs
+    running at the same time don't interfere with each other's timings.
+
+    Parameters
+    ----------
+    jobs : List[BenchmarkJob]
+        the algorithms to execute, each one with its is_exponential flag
+    num_calls : int
+        number of calls that must be make
+    processes : Optional[int]
+        number of worker processes, by default (and at most) the number of available CPUs
+    adaptive : bool
+        Choose the number of calls with run_algorithm_adaptive
+    memory : bool
+        Measure also the memory, see measure_file
+
+    Returns
+    -------
+    For each algorithm, in the same order of jobs, the list measure_time would return.
+
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus: List[int] = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    processes = processes or len(cpus)
+    # two workers on the same CPU would slow down each other's timings
+    if processes > len(cpus):
+        raise ValueError("Too many processes: " + str(processes) + ", only " + str(len(cpus)) + " CPUs available")
+
+    # every worker takes a CPU from the queue when it starts
+    cpu_queue: multiprocessing.Queue = multiprocessing.Queue()
+    for cpu in cpus[:processes]:
+        cpu_queue.put(cpu)
+
+    tasks: List[Tuple[int, str, MSTAlgorithm, int, bool, bool, bool]] = [
+        (index, file, algorithm, num_calls, is_exponential, adaptive, memory)
+        for index, (algorithm, is_exponential) in enumerate(jobs) for file in DATASET]
+    # the biggest graphs first, so the pool doesn't end waiting for a single long job
+    tasks.sort(key=lambda task: os.path.getsize("dataset/" + task[1]), reverse=True)
+
+    results: Dict[Tuple[int, str], BenchmarkResult] = {}
+    with multiprocessing.Pool(processes, initializer=_pin_worker, initargs=(cpu_queue,)) as pool:
+        for done, (key, measure) in enumerate(pool.imap_unordered(_run_job, tasks)):
+            print(str(done + 1) + "/" + str(len(tasks)))
+            results[key] = measure
+
+    # results are put back in the order of the DATASET, as measure_time does
+    return [_group_times([results[index, file] for file in DATASET]) for index in range(len(jobs))]
+
+
+def _pin_worker(cpu_queue: multiprocessing.Queue) -> None:
+    # a worker that replaces another one finds the queue empty, it runs without a CPU of its own
+    # (a short wait and not get_nowait, that fails while another worker is reading the queue)
+    try:
+        cpu: int = cpu_queue.get(timeout=PIN_TIMEOUT)
+    except queue.Empty:
+        return
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+
+def _run_job(task: Tuple[int, str, MSTAlgorithm, int, bool, bool, bool]) -> Tuple[Tuple[int, str], BenchmarkResult]:
+    index, file, algorithm, num_calls, is_exponential, adaptive, memory = task
+    return (index, file), measure_file(file, algorithm, num_calls, is_exponential, adaptive, memory)
+
+
+def _group_times(measures: List[BenchmarkResult]) -> List[Analysis]:
+    # Dict where to store the data of the graphs and the average times of every execution
+    times: Dict[DataGraph, List[Time]] = {}
+    # Dict where to store the data of the graphs and the results of every file
+    results: Dict[DataGraph, List[BenchmarkResult]] = {}
+    # Dict where to store the data of the grpahs and the average of avrage times
+    avg_times: Dict[DataGraph, Time] = {}
+
+    for result in measures:
+        data: DataGraph = (result.n, result.m)
         # Check if the data graph is already in the dict, otherwise append the time
         if data not in times:
             times[data] = []
-        times[data].append(estimate_time)
+            results[data] = []
+        times[data].append(result.timing.median)
+        results[data].append(result)
 
     # Compute the average of all the average times for every graphs.
     # Stroing all in the dict avg_times
@@ -143,7 +382,7 @@ def measure_time(algorithm: MSTAlgorithm, num_calls: int,
     # Covert the dict into list for easier manuality
     analysis: List[Analysis] = []
     for key, items in avg_times.items():
-        analysis.append(Analysis(data=key, time=items))
+        analysis.append(Analysis(data=key, time=items, results=results[key]))
     return analysis
 
 
@@ -180,7 +419,9 @@ def plot(analysis: List[Analysis], constant: float,
 
 
 def run_analysis(algorithm: MSTAlgorithm, complexity_function: ComplexityFunction,
-                 algorithm_name: str, num_calls: int = 1, is_exponential: bool = False) -> List[Analysis]:
+                 algorithm_name: str, num_calls: int = 1, is_exponential: bool = False,
+                 analysis: Optional[List[Analysis]] = None, adaptive: bool = False,
+                 memory: bool = False) -> List[Analysis]:
     """
     Execute the given MST-algorithm for the given number of calls, measure the time of execution
 
@@ -188,12 +429,18 @@ def run_analysis(algorithm: MSTAlgorithm, complexity_function: ComplexityFunctio
     ----------
     is_exponential
     algorithm_name
+    analysis : Optional[List[Analysis]]
+        measures already taken (e.g. by measure_time_parallel), if given the algorithm is not executed
     algorithm : MSTAlgorithm
         is the algorithm to execute
     complexity_function : ComplexityFunction
         is the reference function for the algorithm to be plot
     num_calls : int
         number of calls that must be make
+    adaptive : bool
+        Choose the number of calls with run_algorithm_adaptive, num_calls is ignored
+    memory : bool
+        Measure also the memory, see measure_file
 
     Returns
     -------
@@ -201,7 +448,8 @@ def run_analysis(algorithm: MSTAlgorithm, complexity_function: ComplexityFunctio
         result
 
     """
-    analysis: List[Analysis] = measure_time(algorithm, num_calls, is_exponential)
+    if analysis is None:
+        analysis = measure_time(algorithm, num_calls, is_exponential, adaptive, memory)
     ratios: List[Optional[float]] = [0.0]
     ratios += ([round(analysis[i + 1].time / analysis[i].time, 3)
                 for i in range(len(analysis) - 1)])
@@ -227,6 +475,21 @@ def run_analysis(algorithm: MSTAlgorithm, complexity_function: ComplexityFunctio
     return analysis
 
 
+def save_benchmark(path: str, *analyses: List[Analysis]) -> None:
+    """
+    Save the samples and the statistics of every file measured in the given analyses,
+    in path + ".json" and path + ".csv"
+
+    Parameters
+    ----------
+    path : str
+        path of the files without the extension
+    analyses : List[Analysis]
+        results of run_analysis, one for every algorithm
+    """
+    save_results(path, [result for analysis in analyses for item in analysis for result in item.results])
+
+
 def compare_plot(prim_analysis: List[Analysis], kruskal_union_find_analysis: List[Analysis],
                  naive_kruskal_analysis: List[Analysis]):
     plot(prim_analysis, 2504.639, mlogn, "Prim", " c * (m * log2(n))", 1)
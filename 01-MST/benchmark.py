@@ -0,0 +1,352 @@
+import csv
+import json
+import math
+import statistics
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from memory import MemoryUsage
+
+# Type aliases
+Time = float  # ns
+
+# Samples out of [Q1 - OUTLIER_FENCE * IQR, Q3 + OUTLIER_FENCE * IQR] are outliers (Tukey's fences),
+# the rejection is done only with at least MIN_OUTLIER_SAMPLES samples
+OUTLIER_FENCE: float = 1.5
+MIN_OUTLIER_SAMPLES: int = 4
+
+# With fewer samples in a run the Mann-Whitney U test can't reach p < 0.05 (with 4 and 4 the
+# smallest two-sided p-value is 2 / 70), so the comparison is inconclusive.
+# Up to EXACT_MAX_SAMPLES samples in total, without ties, the exact distribution of U is used
+MIN_TEST_SAMPLES: int = 4
+EXACT_MAX_SAMPLES: int = 40
+
+CSV_HEADER: List[str] = ["File", "Algorithm", "Nodes", "Edges", "Repetitions", "Samples", "Outliers",
+                         "Min", "Median", "P95", "Stddev", "Construction RSS peak", "Construction traced peak",
+                         "Run RSS peak", "Run traced peak"]
+
+
+@dataclass
+class Timing:
+    """
+    A class for represent the times measured running an algorithm on a graph
+
+    Attributes
+    __________
+    samples : List[Time]
+        average time of a call in every sample
+    repetitions : int
+        calls of the algorithm in every sample
+    warmup : List[Time]
+        average time of a call in the runs done before the samples, not used in the statistics
+    """
+    samples: List[Time]
+    repetitions: int
+    warmup: List[Time] = field(default_factory=list)
+
+    @property
+    def kept(self) -> List[Time]:
+        """
+        The samples without the outliers
+        """
+        if len(self.samples) < MIN_OUTLIER_SAMPLES:
+            return list(self.samples)
+
+        q1, _, q3 = statistics.quantiles(self.samples, n=4)
+        low: Time = q1 - OUTLIER_FENCE * (q3 - q1)
+        high: Time = q3 + OUTLIER_FENCE * (q3 - q1)
+        return [sample for sample in self.samples if low <= sample <= high]
+
+    @property
+    def outliers(self) -> int:
+        return len(self.samples) - len(self.kept)
+
+    @property
+    def min(self) -> Time:
+        return min(self.kept)
+
+    @property
+    def median(self) -> Time:
+        return statistics.median(self.kept)
+
+    @property
+    def p95(self) -> Time:
+        # nearest rank
+        kept: List[Time] = sorted(self.kept)
+        return kept[math.ceil(0.95 * len(kept)) - 1]
+
+    @property
+    def stddev(self) -> Time:
+        kept: List[Time] = self.kept
+        return statistics.stdev(kept) if len(kept) > 1 else 0.0
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    A class for represent the times of an algorithm on a file of the dataset
+
+    Attributes
+    __________
+    file : str
+        name of the file in the dataset
+    algorithm : str
+        name of the algorithm
+    n : int
+        number of nodes of the graph
+    m : int
+        number of edges of the graph
+    timing : Timing
+        the measured times
+    construction_memory : Optional[MemoryUsage]
+        memory used to load the graph, if measured
+    run_memory : Optional[MemoryUsage]
+        memory used by a run of the algorithm, if measured
+    """
+    file: str
+    algorithm: str
+    n: int
+    m: int
+    timing: Timing
+    construction_memory: Optional[MemoryUsage] = None
+    run_memory: Optional[MemoryUsage] = None
+
+
+def save_results(path: str, results: List[BenchmarkResult]) -> None:
+    """
+    Save the results in path + ".json", with all the samples, and their statistics
+    in path + ".csv"
+
+    Parameters
+    ----------
+    path : str
+        path of the files without the extension
+    results : List[BenchmarkResult]
+        the results to save
+    """
+    records = []
+    for result in results:
+        timing: Timing = result.timing
+        records.append({"file": result.file, "algorithm": result.algorithm, "n": result.n, "m": result.m,
+                        "repetitions": timing.repetitions, "warmup": timing.warmup, "samples": timing.samples,
+                        "outliers": timing.outliers, "min": timing.min, "median": timing.median,
+                        "p95": timing.p95, "stddev": timing.stddev,
+                        "construction_memory": _memory_record(result.construction_memory),
+                        "run_memory": _memory_record(result.run_memory)})
+
+    with open(path + ".json", "w") as file:
+        json.dump({"created": datetime.now().isoformat(timespec="seconds"), "results": records}, file, indent=1)
+
+    with open(path + ".csv", "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADER)
+        for record in records:
+            writer.writerow([record["file"], record["algorithm"], record["n"], record["m"], record["repetitions"],
+                             len(record["samples"]), record["outliers"], round(record["min"], 2),
+                             round(record["median"], 2), round(record["p95"], 2), round(record["stddev"], 2)]
+                            + _memory_columns(record["construction_memory"]) + _memory_columns(record["run_memory"]))
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    """
+    Load the results saved by save_results
+
+    Parameters
+    ----------
+    path : str
+        path of the json file
+
+    Returns
+    -------
+    List[BenchmarkResult]
+        the saved results, the statistics are computed again from the samples
+    """
+    with open(path) as file:
+        records = json.load(file)["results"]
+
+    return [BenchmarkResult(file=record["file"], algorithm=record["algorithm"], n=record["n"], m=record["m"],
+                            timing=Timing(samples=record["samples"], repetitions=record["repetitions"],
+                                          warmup=record["warmup"]),
+                            construction_memory=_memory_usage(record.get("construction_memory")),
+                            run_memory=_memory_usage(record.get("run_memory")))
+            for record in records]
+
+
+def _memory_record(usage: Optional[MemoryUsage]) -> Optional[Dict[str, Optional[int]]]:
+    return None if usage is None else asdict(usage)
+
+
+def _memory_usage(record: Optional[Dict[str, Optional[int]]]) -> Optional[MemoryUsage]:
+    return None if record is None else MemoryUsage(**record)
+
+
+def _memory_columns(record: Optional[Dict[str, Optional[int]]]) -> List[Optional[int]]:
+    # empty cells if the memory was not measured
+    if record is None:
+        return [None, None]
+    return [record["rss_peak"], record["traced_peak"]]
+
+
+@dataclass
+class Comparison:
+    """
+    A class for represent the change of time of an algorithm on a file between two runs
+
+    Attributes
+    __________
+    file : str
+        name of the file in the dataset
+    algorithm : str
+        name of the algorithm
+    baseline : Time
+        median time in the first run
+    candidate : Time
+        median time in the second run
+    p_value : Optional[float]
+        two-sided p-value of the Mann-Whitney U test on the samples,
+        None (inconclusive) if a run has less than MIN_TEST_SAMPLES samples
+    """
+    file: str
+    algorithm: str
+    baseline: Time
+    candidate: Time
+    p_value: Optional[float]
+
+    @property
+    def ratio(self) -> float:
+        # > 1 is a slowdown, < 1 a speedup
+        return self.candidate / self.baseline
+
+    @property
+    def inconclusive(self) -> bool:
+        return self.p_value is None
+
+    def is_regression(self, threshold: float, alpha: float) -> bool:
+        # without enough samples for the test a slowdown is not a regression, it is inconclusive
+        return not self.inconclusive and self.ratio > 1 + threshold and self.p_value < alpha
+
+
+def mann_whitney(first: List[Time], second: List[Time]) -> float:
+    """
+    Two-sided p-value of the Mann-Whitney U test: exact for small samples without ties,
+    otherwise with the normal approximation and the correction for the ties
+
+    Parameters
+    ----------
+    first : List[Time]
+    second : List[Time]
+
+    Returns
+    -------
+    float
+        the probability of a difference at least as big if the two samples come from
+        the same distribution
+    """
+    values: List[Tuple[Time, int]] = sorted([(value, 0) for value in first] + [(value, 1) for value in second])
+    total: int = len(values)
+
+    # rank of the values, the tied ones get the average of their ranks
+    rank_sum: float = 0.0
+    ties: float = 0.0
+    start: int = 0
+    while start < total:
+        end: int = start
+        while end + 1 < total and values[end + 1][0] == values[start][0]:
+            end += 1
+        rank: float = (start + end) / 2 + 1
+        rank_sum += rank * sum(1 for index in range(start, end + 1) if values[index][1] == 0)
+        ties += (end - start + 1) ** 3 - (end - start + 1)
+        start = end + 1
+
+    n1, n2 = len(first), len(second)
+    u: float = rank_sum - n1 * (n1 + 1) / 2
+    if ties == 0 and total <= EXACT_MAX_SAMPLES:
+        return _exact_p_value(int(u), n1, n2)
+
+    mean: float = n1 * n2 / 2
+    variance: float = n1 * n2 / 12 * ((total + 1) - ties / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z: float = (u - mean) / math.sqrt(variance)
+    return 2 * (1 - statistics.NormalDist().cdf(abs(z)))
+
+
+def _exact_p_value(u: int, n1: int, n2: int) -> float:
+    # counts[i][j][k]: orderings of i values of the first sample and j of the second with U = k,
+    # the biggest value is of the first sample (it beats all the j others) or of the second
+    counts: List[List[List[int]]] = [[[1] for _ in range(n2 + 1)] for _ in range(n1 + 1)]
+    for i in range(1, n1 + 1):
+        for j in range(1, n2 + 1):
+            counts[i][j] = [0] * (i * j + 1)
+            for k, count in enumerate(counts[i - 1][j]):
+                counts[i][j][k + j] += count
+            for k, count in enumerate(counts[i][j - 1]):
+                counts[i][j][k] += count
+
+    distribution: List[int] = counts[n1][n2]
+    lower: int = sum(distribution[:u + 1])
+    upper: int = sum(distribution[u:])
+    return min(1.0, 2 * min(lower, upper) / sum(distribution))
+
+
+def compare_results(baseline: List[BenchmarkResult], candidate: List[BenchmarkResult]) -> List[Comparison]:
+    """
+    Align the two runs by file and algorithm and compare their times, the pairs
+    present in only one of the runs are skipped (see unmatched_results)
+
+    Parameters
+    ----------
+    baseline : List[BenchmarkResult]
+        the reference run
+    candidate : List[BenchmarkResult]
+        the run to check
+
+    Returns
+    -------
+    List[Comparison]
+        a comparison for every pair in both runs, in the order of the candidate run
+    """
+    baseline_timings: Dict[Tuple[str, str], Timing] = {(result.file, result.algorithm): result.timing
+                                                        for result in baseline}
+
+    comparisons: List[Comparison] = []
+    for result in candidate:
+        key: Tuple[str, str] = (result.file, result.algorithm)
+        if key not in baseline_timings:
+            continue
+
+        old: Timing = baseline_timings[key]
+        new: Timing = result.timing
+        p_value: Optional[float] = None
+        if len(old.kept) >= MIN_TEST_SAMPLES and len(new.kept) >= MIN_TEST_SAMPLES:
+            p_value = mann_whitney(old.kept, new.kept)
+
+        comparisons.append(Comparison(file=result.file, algorithm=result.algorithm,
+                                      baseline=old.median, candidate=new.median, p_value=p_value))
+    return comparisons
+
+
+def unmatched_results(baseline: List[BenchmarkResult],
+                      candidate: List[BenchmarkResult]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Find the pairs of file and algorithm present in only one of the two runs
+
+    Parameters
+    ----------
+    baseline : List[BenchmarkResult]
+        the reference run
+    candidate : List[BenchmarkResult]
+        the run to check
+
+    Returns
+    -------
+    Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]
+        the pairs only in the baseline run and the ones only in the candidate run
+    """
+    baseline_keys: List[Tuple[str, str]] = [(result.file, result.algorithm) for result in baseline]
+    candidate_keys: List[Tuple[str, str]] = [(result.file, result.algorithm) for result in candidate]
+    in_baseline, in_candidate = set(baseline_keys), set(candidate_keys)
+    return ([key for key in baseline_keys if key not in in_candidate],
+            [key for key in candidate_keys if key not in in_baseline])
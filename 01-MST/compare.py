@@ -0,0 +1,64 @@
+import sys
+from argparse import ArgumentParser
+from typing import List, Optional
+
+from benchmark import MIN_TEST_SAMPLES, BenchmarkResult, Comparison, compare_results, load_results, \
+    unmatched_results
+
+
+def main(args: Optional[List[str]] = None):
+    # Compare two runs saved by main.py, e.g.: python compare.py old/benchmark.json benchmark.json
+    # The exit code is 1 if there is a regression or, unless --allow-inconclusive, an inconclusive
+    # comparison: the runs need at least MIN_TEST_SAMPLES samples, e.g. main.py -a
+    argument_parser = ArgumentParser(description="Compare two benchmark runs of the MST algorithms")
+    argument_parser.add_argument("baseline", help="json file of the reference run")
+    argument_parser.add_argument("candidate", help="json file of the run to check")
+    argument_parser.add_argument("--threshold", type=float, default=0.05,
+                                 help="relative slowdown above which a change is a regression (default 0.05)")
+    argument_parser.add_argument("--alpha", type=float, default=0.05,
+                                 help="significance level of the Mann-Whitney U test (default 0.05)")
+    argument_parser.add_argument("--allow-inconclusive", action="store_true",
+                                 help="exit with 0 even if some comparisons have too few samples for the test")
+    arguments = argument_parser.parse_args(args)
+
+    baseline: List[BenchmarkResult] = load_results(arguments.baseline)
+    candidate: List[BenchmarkResult] = load_results(arguments.candidate)
+    comparisons: List[Comparison] = compare_results(baseline, candidate)
+
+    regressions: int = 0
+    inconclusive: int = 0
+    print("File\t\t\t\t\tAlgorithm\t\t\tBaseline(ns)\tCandidate(ns)\tSpeedup\t\tp-value")
+    print(50 * "-")
+    for comparison in comparisons:
+        p_value: str = "n/a" if comparison.inconclusive else "%.4f" % comparison.p_value
+        mark: str = ""
+        if comparison.inconclusive:
+            inconclusive += 1
+            mark = "INCONCLUSIVE"
+        elif comparison.is_regression(arguments.threshold, arguments.alpha):
+            regressions += 1
+            mark = "REGRESSION"
+        print(comparison.file, comparison.algorithm, round(comparison.baseline, 2), round(comparison.candidate, 2),
+              "%.3fx" % (1 / comparison.ratio), p_value, mark, sep="\t\t")
+    print(50 * "-")
+
+    only_baseline, only_candidate = unmatched_results(baseline, candidate)
+    for (file, algorithm) in only_baseline:
+        print(file, algorithm, "only in the baseline run", sep="\t\t")
+    for (file, algorithm) in only_candidate:
+        print(file, algorithm, "only in the candidate run", sep="\t\t")
+    if only_baseline or only_candidate:
+        print(50 * "-")
+
+    print("%d compared, %d regressions above %.1f%%" % (len(comparisons), regressions, arguments.threshold * 100))
+    if inconclusive > 0:
+        print("%d inconclusive, with less than %d samples in a run" % (inconclusive, MIN_TEST_SAMPLES))
+    if only_baseline or only_candidate:
+        print("%d only in the baseline run, %d only in the candidate run" % (len(only_baseline), len(only_candidate)))
+
+    failed: bool = regressions > 0 or (inconclusive > 0 and not arguments.allow_inconclusive)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+import parser
+from datastructure.csr_graph import CSRGraph, csr_from_columns
+from datastructure.graph import Graph
+from parser import ColumnContent
+
+@dataclass
+class CompactGraph(CSRGraph):
+    """
+    A CSRGraph whose nodes are renamed to dense ids from 0 to n - 1 when it is built,
+    so every per-node array has exactly n entries. The edges are only in the CSR adjacency.
+    The results of the algorithms are on the ids, relabel translates them back.
+
+    Attributes
+    __________
+    labels : np.ndarray
+        original name of each node id, sorted
+    """
+    __slots__ = ("labels",)
+
+    labels: np.ndarray
+
+    def get_id(self, label: int) -> Optional[int]:
+        """
+        Returns the id of the node with the given original name, None if it is not in the graph
+        """
+        node: int = int(np.searchsorted(self.labels, label))
+        if node < self.n and self.labels[node] == label:
+            return node
+        return None
+
+    def get_label(self, node: int) -> int:
+        """
+        Returns the original name of the node with the given id
+        """
+        return int(self.labels[node])
+
+    def relabel(self, graph: Graph) -> Graph:
+        """
+        Translate a graph on the ids of this graph (e.g. its MST) back to the original names
+
+        Parameters
+        ----------
+        graph : Graph
+            a graph whose nodes are ids of this graph
+
+        Returns
+        -------
+        Graph
+            the same graph with the original names of the nodes
+        """
+        labels = self.labels.tolist()
+        relabeled: Graph = Graph()
+        for (a, b), weight in graph.get_all_edges().items():
+            relabeled.add_edge(labels[a], labels[b], weight)
+        return relabeled
+
+
+def compact_from_columns(sources: np.ndarray, targets: np.ndarray, weights: np.ndarray) -> CompactGraph:
+    """
+    Build a CompactGraph from three aligned columns of edges, with the same semantics of
+    Graph.add_edge: self loops are dropped and of parallel edges only the lighter is kept
+
+    Parameters
+    ----------
+    sources : np.ndarray
+        first endpoints of the edges
+    targets : np.ndarray
+        second endpoints of the edges
+    weights : np.ndarray
+        weights of the edges
+
+    Returns
+    -------
+    CompactGraph
+        the graph built from the columns, on the ids of the nodes
+    """
+    sources = np.asarray(sources, dtype=np.int32)
+    targets = np.asarray(targets, dtype=np.int32)
+
+    # the id of a node is its position among the sorted names
+    labels: np.ndarray = np.unique(np.concatenate((sources, targets)))
+    n: int = len(labels)
+    csr: CSRGraph = csr_from_columns(np.searchsorted(labels, sources), np.searchsorted(labels, targets),
+                                     weights, np.arange(n, dtype=np.int32))
+
+    fields: Dict[str, object] = {name: getattr(csr, name) for name in CSRGraph.__dataclass_fields__}
+    return CompactGraph(**fields, labels=labels)
+
+
+def compact_graph_from_file(path: str, use_cache: bool = True) -> CompactGraph:
+    """
+    Load the graph from a file as a CompactGraph, reading the edges in bulk as NumPy columns
+
+    Parameters
+    ----------
+    path : str
+        the relative or absolute path to the input source file
+    use_cache : bool
+        if True the edges are memory-mapped from the binary cache next to the file
+        (written on the first load), otherwise the file is always parsed
+
+    Returns
+    -------
+    CompactGraph
+        the graph built based on the file content, on the ids of the nodes
+    """
+    content: ColumnContent = parser.load_columns(path, use_cache)
+    return compact_from_columns(content.sources, content.targets, content.weights)
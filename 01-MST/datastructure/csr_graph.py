@@ -0,0 +1,280 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+import parser
+from datastructure.graph import Graph
+from parser import ColumnContent
+
+# Type aliases
+EdgeColumns = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+@dataclass
+class CSRGraph:
+    """
+    A class for represent an undirected simple graph in Compressed Sparse Row format.
+    The adjacency of node i is stored in neighbors[offsets[i]:offsets[i + 1]] and the
+    corresponding weights in weights[offsets[i]:offsets[i + 1]].
+    The adjacency of every node is sorted by neighbor, so an edge is found with a binary search.
+    The arrays are read one item at a time through memoryviews of their buffers, that are much
+    faster than numpy to read a single item and, unlike lists, don't copy the edges.
+
+    Attributes
+    __________
+    n : int
+        number of nodes in the graph
+    m : int
+        number of edges in the graph
+    nodes : List[int]
+        names of the nodes in the graph
+    offsets : np.ndarray
+        start position of the adjacency of each node (indexed by node name)
+    neighbors : np.ndarray
+        adjacent node names, contiguous for each node
+    weights : np.ndarray
+        weights of the edges, aligned with neighbors
+    """
+    __slots__ = ("n", "m", "nodes", "offsets", "neighbors", "weights",
+                 "_offsets_view", "_neighbors_view", "_weights_view")
+
+    n: int
+    m: int
+    nodes: List[int]
+    offsets: np.ndarray
+    neighbors: np.ndarray
+    weights: np.ndarray
+
+    def __post_init__(self):
+        self._offsets_view: memoryview = memoryview(self.offsets)
+        self._neighbors_view: memoryview = memoryview(self.neighbors)
+        self._weights_view: memoryview = memoryview(self.weights)
+
+    def get_all_nodes(self) -> List[int]:
+        """
+        Returns the names of all the nodes in the graph
+
+        Returns
+        -------
+        List[int]
+            names of the nodes in the graph
+        """
+        return self.nodes
+
+    def iter_node_edges(self, node_name: int) -> Iterator[Tuple[int, int]]:
+        """
+        Returns the adjacent nodes of a given node together with the weight of the edge
+
+        Parameters
+        ----------
+        node_name : int
+
+        Returns
+        -------
+        Iterator[Tuple[int, int]]
+            pairs (adjacent node, weight)
+        """
+        start: int = self._offsets_view[node_name]
+        end: int = self._offsets_view[node_name + 1]
+        return zip(self._neighbors_view[start:end], self._weights_view[start:end])
+
+    def get_weight(self, a: int, b: int) -> Optional[int]:
+        """
+        Return the weight of the edge that connects a to b
+
+        Parameters
+        ----------
+        a : int
+            first endpoint
+        b : int
+            second endpoint
+
+        Returns
+        -------
+        Optional[int]
+            weight of the edge that connects a to b, None if the edge doesn't exist
+        """
+        neighbors: memoryview = self._neighbors_view
+        end: int = self._offsets_view[a + 1]
+        position: int = bisect_left(neighbors, b, self._offsets_view[a], end)
+        if position == end or neighbors[position] != b:
+            return None
+        return self._weights_view[position]
+
+    def get_edge_columns(self) -> EdgeColumns:
+        """
+        Returns every edge of the graph once, as three aligned columns
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            first endpoints, second endpoints and weights of the edges
+        """
+        heads = np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+        # every edge appears twice in the adjacency, keep only the a < b copy
+        mask = heads < self.neighbors
+        return heads[mask], self.neighbors[mask], self.weights[mask]
+
+    def iter_sorted_edges(self, lazy: bool = False) -> Iterator[Tuple[int, int, int]]:
+        """
+        Returns the edges of the graph in crescent order of weight
+
+        Parameters
+        ----------
+        lazy : bool
+            if True the edges are sorted in chunks of growing size, each one selected with
+            a partial sort only when the previous one has been consumed, so a consumer that
+            stops early doesn't pay for sorting the edges it never inspects
+
+        Returns
+        -------
+        Iterator[Tuple[int, int, int]]
+            triples (a, b, weight) in crescent order of weight
+        """
+        heads, tails, weights = self.get_edge_columns()
+        if not lazy:
+            order = np.argsort(weights, kind="stable")
+            return zip(heads[order].tolist(), tails[order].tolist(), weights[order].tolist())
+        return self._iter_chunks(heads, tails, weights)
+
+    def _iter_chunks(self, heads: np.ndarray, tails: np.ndarray,
+                     weights: np.ndarray) -> Iterator[Tuple[int, int, int]]:
+        # a spanning tree has n - 1 edges, so the first chunk is likely to be enough
+        chunk: int = max(2 * self.n, 1024)
+        while len(weights) > 0:
+            if chunk < len(weights):
+                # move the chunk lightest edges in front, in any order, then sort only them
+                partition = np.argpartition(weights, chunk - 1)
+                lightest, rest = partition[:chunk], partition[chunk:]
+            else:
+                lightest, rest = np.arange(len(weights)), np.empty(0, dtype=np.intp)
+            order = lightest[np.argsort(weights[lightest], kind="stable")]
+            yield from zip(heads[order].tolist(), tails[order].tolist(), weights[order].tolist())
+
+            heads, tails, weights = heads[rest], tails[rest], weights[rest]
+            chunk *= 2
+
+    def sum_weights(self) -> int:
+        """
+        Returns the sum of all edges
+
+        Returns
+        -------
+        int
+            sum of all edges
+        """
+        # every edge is stored in both directions
+        return int(self.weights.sum(dtype=np.int64)) // 2
+
+
+# Any graph representation the MST algorithms can consume
+AnyGraph = Union[Graph, CSRGraph]
+
+
+def csr_from_columns(sources: np.ndarray, targets: np.ndarray, weights: np.ndarray,
+                     nodes: Optional[np.ndarray] = None) -> CSRGraph:
+    """
+    Build a CSRGraph from three aligned columns of edges, with the same semantics of
+    Graph.add_edge: self loops are dropped and of parallel edges only the lighter is kept
+
+    Parameters
+    ----------
+    sources : np.ndarray
+        first endpoints of the edges
+    targets : np.ndarray
+        second endpoints of the edges
+    weights : np.ndarray
+        weights of the edges
+    nodes : Optional[np.ndarray]
+        names of the nodes in the graph, by default the endpoints of the edges
+
+    Returns
+    -------
+    CSRGraph
+        the graph built from the columns
+    """
+    sources = np.asarray(sources, dtype=np.int32)
+    targets = np.asarray(targets, dtype=np.int32)
+    weights = np.asarray(weights, dtype=np.int32)
+
+    if nodes is None:
+        # nodes are counted even when they only appear in a self loop, like in Graph
+        nodes = np.unique(np.concatenate((sources, targets)))
+
+    not_loop = sources != targets
+    low = np.minimum(sources, targets)[not_loop]
+    high = np.maximum(sources, targets)[not_loop]
+    weights = weights[not_loop]
+
+    # sort by endpoints then by weight, so the first of each group is the lighter one
+    order = np.lexsort((weights, high, low))
+    low, high, weights = low[order], high[order], weights[order]
+    first = np.ones(len(low), dtype=bool)
+    first[1:] = (low[1:] != low[:-1]) | (high[1:] != high[:-1])
+    low, high, weights = low[first], high[first], weights[first]
+
+    # every undirected edge is stored in the adjacency of both endpoints
+    heads = np.concatenate((low, high))
+    tails = np.concatenate((high, low))
+    both_weights = np.concatenate((weights, weights))
+    # sorted by node and then by neighbor, for the binary search of get_weight
+    order = np.lexsort((tails, heads))
+
+    size: int = int(nodes[-1]) + 1 if len(nodes) > 0 else 0
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(heads, minlength=size), out=offsets[1:])
+
+    return CSRGraph(n=len(nodes), m=len(low), nodes=nodes.tolist(), offsets=offsets,
+                    neighbors=tails[order], weights=both_weights[order])
+
+
+def csr_from_graph(graph: Graph) -> CSRGraph:
+    """
+    Convert a Graph in the equivalent CSRGraph
+
+    Parameters
+    ----------
+    graph : Graph
+        the graph to convert
+
+    Returns
+    -------
+    CSRGraph
+        the graph in Compressed Sparse Row format
+    """
+    sources: List[int] = []
+    targets: List[int] = []
+    weights: List[int] = []
+    for (a, b), weight in graph.get_all_edges().items():
+        sources.append(a)
+        targets.append(b)
+        weights.append(weight)
+
+    return csr_from_columns(np.array(sources, dtype=np.int32),
+                            np.array(targets, dtype=np.int32),
+                            np.array(weights, dtype=np.int32),
+                            np.array(sorted(graph.get_all_nodes()), dtype=np.int32))
+
+
+def csr_graph_from_file(path: str, use_cache: bool = True) -> CSRGraph:
+    """
+    Load the graph from a file directly in Compressed Sparse Row format,
+    reading the edges in bulk as NumPy columns
+
+    Parameters
+    ----------
+    path : str
+        the relative or absolute path to the input source file
+    use_cache : bool
+        if True the edges are memory-mapped from the binary cache next to the file
+        (written on the first load), otherwise the file is always parsed
+
+    Returns
+    -------
+    CSRGraph
+        the graph built based on the file content
+    """
+    content: ColumnContent = parser.load_columns(path, use_cache)
+    return csr_from_columns(content.sources, content.targets, content.weights)
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from heapq import heapify, heappop
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
 import parser
-from parser import Content
+from parser import ColumnContent
+from profiler import ProfileStats
 
 Node = int
 Edges = Dict[Tuple[Node, Node], int]
@@ -103,7 +106,21 @@ class Graph:
         self.adjacency_list[a][b] = weight
         self.adjacency_list[b][a] = weight
 
-        self.edges[(a, b)] = weight
+        self.edges[self._edge_key(a, b)] = weight
+
+    def get_edge_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns all the edges in the graph as three aligned columns
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            first endpoints, second endpoints and weights of the edges
+        """
+        edges: Edges = self.get_all_edges()
+        endpoints = np.array(list(edges.keys()), dtype=np.int32).reshape(-1, 2)
+        weights = np.fromiter(edges.values(), dtype=np.int32, count=len(edges))
+        return endpoints[:, 0], endpoints[:, 1], weights
 
     def get_all_edges(self) -> Edges:
         """
@@ -130,7 +147,11 @@ class Graph:
         """
         self.get_node_edges(a).pop(b)
         self.get_node_edges(b).pop(a)
-        del self.edges[(a, b)]
+        del self.edges[self._edge_key(a, b)]
+
+    def _edge_key(self, a: int, b: int) -> Tuple[int, int]:
+        # the edge is in edges in the order it was added, that may be (b, a)
+        return (a, b) if (a, b) in self.edges else (b, a)
 
     def get_node_edges(self, node_name: int) -> Dict[int, int]:
         """
@@ -150,6 +171,21 @@ class Graph:
             raise Exception("Node not found")
         return self.adjacency_list[node_name]
 
+    def iter_node_edges(self, node_name: int) -> Iterator[Tuple[int, int]]:
+        """
+        Returns the adjacent nodes of a given node together with the weight of the edge
+
+        Parameters
+        ----------
+        node_name : int
+
+        Returns
+        -------
+        Iterator[Tuple[int, int]]
+            pairs (adjacent node, weight)
+        """
+        return iter(self.get_node_edges(node_name).items())
+
     def get_all_nodes(self) -> Dict[int, Dict[int, int]]:
         """
         Return all the nodes in the graph with their respective adjacency list
@@ -180,7 +216,7 @@ class Graph:
         """
         return self.adjacency_list[a].get(b)
 
-    def is_cyclic(self, starting_node: int) -> bool:
+    def is_cyclic(self, starting_node: int, stats: Optional[ProfileStats] = None) -> bool:
         """
         Returns true if the graph is cyclic, otherwise false
 
@@ -188,6 +224,8 @@ class Graph:
         ----------
         starting_node : int
             the node name on which start the analysis
+        stats : Optional[ProfileStats]
+            if given, the number of visited nodes is added to its cycle_check_visits counter
 
         Returns
         -------
@@ -202,6 +240,8 @@ class Graph:
             future_level: List[int] = []
             for node_name in nodes_to_visit:
                 if visited_nodes.get(node_name):
+                    if stats is not None:
+                        stats.count("cycle_check_visits", len(visited_nodes))
                     return True  # è ciclico
 
                 visited_nodes[node_name] = True
@@ -219,6 +259,8 @@ class Graph:
                         future_level.append(adj_node)
 
                 nodes_to_visit = future_level
+        if stats is not None:
+            stats.count("cycle_check_visits", len(visited_nodes))
         return False
 
     def sum_weights(self) -> int:
@@ -247,8 +289,35 @@ class Graph:
         # https://stackoverflow.com/questions/613183/how-do-i-sort-a-dictionary-by-value
         return dict(sorted(self.get_all_edges().items(), key=lambda item: item[1]))
 
+    def iter_sorted_edges(self, lazy: bool = False) -> Iterator[Tuple[int, int, int]]:
+        """
+        Returns the edges of the graph in crescent order of weight
+
+        Parameters
+        ----------
+        lazy : bool
+            if True the edges are kept in a heap (built in linear time) and each one is
+            extracted only when requested, so a consumer that stops early doesn't pay
+            for sorting the edges it never inspects
+
+        Returns
+        -------
+        Iterator[Tuple[int, int, int]]
+            triples (a, b, weight) in crescent order of weight
+        """
+        if not lazy:
+            for (a, b), weight in self.get_sorted_edges().items():
+                yield a, b, weight
+            return
+
+        queue: List[Tuple[int, int, int]] = [(weight, a, b) for (a, b), weight in self.get_all_edges().items()]
+        heapify(queue)
+        while queue:
+            weight, a, b = heappop(queue)
+            yield a, b, weight
+
 
-def graph_from_file(path: str) -> Graph:
+def graph_from_file(path: str, use_cache: bool = True) -> Graph:
     """
     Load the graph from a file
 
@@ -256,6 +325,9 @@ def graph_from_file(path: str) -> Graph:
     ----------
     path : str
         the relative or absolute path to the input source file
+    use_cache : bool
+        if True the edges are memory-mapped from the binary cache next to the file
+        (written on the first load), otherwise the file is always parsed
 
     Returns
     -------
@@ -263,12 +335,14 @@ def graph_from_file(path: str) -> Graph:
         the graph built based on the file content
 
     """
-    return _graph_from_content(parser.parse(path))
+    return _graph_from_columns(parser.load_columns(path, use_cache))
 
 
-def _graph_from_content(content: Content) -> Graph:
+def _graph_from_columns(content: ColumnContent) -> Graph:
+    # The edges are added one by one on purpose: most of the time is spent creating the dicts
+    # of the adjacency lists, that a bulk construction with NumPy has to create all the same
     graph: Graph = Graph()
-    for a, b, weight in content.list_triple:
+    for a, b, weight in zip(content.sources.tolist(), content.targets.tolist(), content.weights.tolist()):
         graph.add_edge(a, b, weight)
 
     return graph
@@ -1,121 +1,97 @@
 import sys
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Optional
+from datastructure.csr_graph import AnyGraph
 from datastructure.graph import Graph
+from datastructure.spanning_tree import SpanningTree, tree_from_parents
+from profiler import ProfileStats
 
 
-@dataclass
-class HeapNode:
-    name: int
-    key: int
-    parent: int
-
-    def __init__(self, name, key=0, parent=0):
-        self.name = name
-        self.key = key
-        self.parent = parent
-
-    def __lt__(self, other):
-        return self.key < other.key
-
-    def __gt__(self, other):
-        return self.key > other.key
-
-    def __ge__(self, other):
-        return self.key >= other.key
-
-    def __eq__(self, other):
-        return self.name == other.name
-
-
-def _left(index: int) -> int:
-    """
-    Returns the left child index of the input index
-    Parameters
-    ----------
-    index : int
-        input index
-
-    Returns
-    -------
-    int
-        index of the left child
-    """
-    return index * 2 + 1
-
-
-def _right(index: int) -> int:
-    """
-    Returns the right child index of the input index
-    Parameters
-    ----------
-    index : int
-        input index
-
-    Returns
-    -------
-    int
-        index of the right child
-    """
-    return index * 2 + 2
-
-
-def _parent(index: int) -> int:
+class Heap:
     """
-    Returns the parent node index of the input index
-    Parameters
-    ----------
-    index : int
-        input index
-
-    Returns
-    -------
-    int
-        index of the parent node
+    A min priority queue with decrease-key, indexed by node name.
+    There is no object per node: keys, parents and positions in the heap are stored
+    in parallel lists indexed by the node name, and the heap itself only stores names.
+
+    Attributes
+    __________
+    heap : List[int]
+        names of the nodes still in the queue, ordered as a binary heap on their key
+    keys : List[int]
+        key of each node
+    parents : List[int]
+        parent of each node in the spanning tree, -1 if it has none
+    indexes : List[int]
+        position of each node in heap, -1 if it is not in the queue
+    names : List[int]
+        names of all the nodes the queue has been initialized with
     """
-    return (index - 1) // 2
-
-
-@dataclass
-class Heap:
-    heap: List[HeapNode]
-    nodes: Dict[int, HeapNode]
-    indexes: Dict[int, int]
+    __slots__ = ("heap", "keys", "parents", "indexes", "names")
 
     def __init__(self):
-        self.heap = []
-        self.nodes = {}
-        self.indexes = {}
-
-    def init_nodes(self, graph: Graph, starting_node: int):
-        for node in graph.get_all_nodes():
-            self.nodes[node] = HeapNode(node, sys.maxsize, -1)
-
-        self.nodes[starting_node].key = 0
-
-        for heap_node in self.nodes.values():
-            self.push(heap_node)
-
-    def sift_up(self, node_index):
-        if node_index == 0:
-            return
-        parent: int = _parent(node_index)
-        while node_index > 0 and self.heap[parent] > self.heap[node_index]:
-            self.swap(node_index, parent)
+        self.heap: List[int] = []
+        self.keys: List[int] = []
+        self.parents: List[int] = []
+        self.indexes: List[int] = []
+        self.names: List[int] = []
+
+    def init_nodes(self, graph: AnyGraph, starting_node: int):
+        self.names = list(graph.get_all_nodes())
+        size: int = max(self.names, default=-1) + 1
+
+        self.keys = [sys.maxsize] * size
+        self.parents = [-1] * size
+        self.indexes = [-1] * size
+
+        self.keys[starting_node] = 0
+
+        # every other key is maxsize, so the starting node at the root is already a valid heap
+        self.heap = list(self.names)
+        root: int = self.heap.index(starting_node)
+        self.heap[0], self.heap[root] = self.heap[root], self.heap[0]
+
+        for index, name in enumerate(self.heap):
+            self.indexes[name] = index
+
+    def sift_up(self, node_index: int):
+        heap, keys, indexes = self.heap, self.keys, self.indexes
+        name: int = heap[node_index]
+        key: int = keys[name]
+
+        # move the parents down until the right position of the node is found
+        while node_index > 0:
+            parent: int = (node_index - 1) >> 1
+            parent_name: int = heap[parent]
+            if keys[parent_name] <= key:
+                break
+            heap[node_index] = parent_name
+            indexes[parent_name] = node_index
             node_index = parent
-            if node_index != 0:
-                parent: int = _parent(node_index)
-
-    def sift_down(self, node_index):
-        left_index = _left(node_index)
-        while left_index < self.size():
-            minimum_child_index = self.get_min_child_index(node_index)
-            if self.heap[node_index] > self.heap[minimum_child_index]:
-                self.swap(node_index, minimum_child_index)
-            else:
-                return
-            node_index = minimum_child_index
-            left_index = _left(node_index)
+
+        heap[node_index] = name
+        indexes[name] = node_index
+
+    def sift_down(self, node_index: int):
+        heap, keys, indexes = self.heap, self.keys, self.indexes
+        size: int = len(heap)
+        name: int = heap[node_index]
+        key: int = keys[name]
+
+        # move the minimum children up until the right position of the node is found
+        child: int = 2 * node_index + 1
+        while child < size:
+            right: int = child + 1
+            if right < size and keys[heap[right]] <= keys[heap[child]]:
+                child = right
+            child_name: int = heap[child]
+            if keys[child_name] >= key:
+                break
+            heap[node_index] = child_name
+            indexes[child_name] = node_index
+            node_index = child
+            child = 2 * node_index + 1
+
+        heap[node_index] = name
+        indexes[name] = node_index
 
     def size(self) -> int:
         return len(self.heap)
@@ -123,104 +99,49 @@ class Heap:
     def last_index(self):
         return self.size() - 1
 
-    def swap(self, index1, index2):
-        """
-        Swap 2 nodes updating the indexes' dictionary
-        Parameters
-        ----------
-        index1
-        index2
-
-        """
-        self.indexes[self.heap[index1].name] = index2
-        self.indexes[self.heap[index2].name] = index1
-
-        self.heap[index1], self.heap[index2] = self.heap[index2], self.heap[index1]
-
     def is_empty(self) -> bool:
         return len(self.heap) == 0
 
-    def push(self, node: HeapNode):
-        """
-        Add a node in the heap
-        Parameters
-        ----------
-        node : HeapNode
-            input node
-
-        """
-        self.heap.append(node)
-        self.indexes[node.name] = self.last_index()
-        self.sift_up(self.last_index())
-
-    def get(self, node_index: int) -> HeapNode:
+    def get(self, node_index: int) -> int:
         return self.heap[node_index]
 
-    def get_by_name(self, node_name: int) -> Optional[HeapNode]:
+    def get_by_name(self, node_name: int) -> Optional[int]:
         """
-        Returns a HeapNode (if exists) by its name
+        Returns the key of a node by its name, if the node is still in the heap
         Parameters
         ----------
-        node_name : str
+        node_name : int
 
         Returns
         -------
-
+        Optional[int]
+            the key of the node, None if the node has already been popped
         """
-        node: HeapNode = self.nodes[node_name]
-        if self.indexes[node_name] > self.last_index():
+        if self.indexes[node_name] < 0:
             return None
 
-        return node
+        return self.keys[node_name]
 
-    def get_min_child_index(self, node_index: int) -> int:
-        """
-        Returns the index of the minimum child of a given node
-        Parameters
-        ----------
-        node_index : int
-            input node
-
-        Returns
-        -------
-        Minimum child of the input node
-        """
-        left_index = _left(node_index)
-
-        if left_index > self.last_index():
-            # Nessun figlio
-            raise Exception("No child")
-
-        if left_index == self.last_index():
-            return left_index  # unico figlio
-
-        right_index = _right(node_index)
-
-        if self.heap[left_index] < self.heap[right_index]:
-            return left_index
-
-        return right_index
-
-    def pop(self) -> HeapNode:
+    def pop(self) -> int:
         """
         Returns the minimum node in the heap and removes it from the heap
         Returns
         -------
-        HeapNode
-            minimum node in the heap
+        int
+            name of the minimum node in the heap
         """
         if self.is_empty():
             raise Exception("Heap empty")
 
-        min_node = self.heap[0]
-
-        self.swap(0, self.last_index())
+        min_name: int = self.heap[0]
+        last_name: int = self.heap.pop()
+        self.indexes[min_name] = -1
 
-        self.heap.pop()
+        if self.heap:
+            self.heap[0] = last_name
+            self.sift_down(0)
 
-        self.sift_down(0)
-
-        return min_node
+        return min_name
 
     def update(self, node_index: int, new_key: int):
         """
@@ -231,8 +152,9 @@ class Heap:
         new_key
 
         """
-        old_key = self.heap[node_index].key
-        self.heap[node_index].key = new_key
+        name: int = self.heap[node_index]
+        old_key: int = self.keys[name]
+        self.keys[name] = new_key
 
         if old_key > new_key:
             self.sift_up(node_index)
@@ -251,7 +173,46 @@ class Heap:
         """
         graph: Graph = Graph(0)
 
-        for node in self.nodes.values():
-            if node.parent != -1:
-                graph.add_edge(node.name, node.parent, node.key)
+        for name in self.names:
+            if self.parents[name] != -1:
+                graph.add_edge(name, self.parents[name], self.keys[name])
         return graph
+
+    def build_tree(self) -> SpanningTree:
+        """
+        Returns the tree found by Prim as a SpanningTree, without building a Graph
+
+        Returns
+        -------
+        SpanningTree
+            the edge from every node to its parent
+        """
+        return tree_from_parents(self.names, self.parents, self.keys)
+
+
+class ProfiledHeap(Heap):
+    """
+    A Heap that counts its sifts and decrease-keys and times pop and update in the given stats
+    """
+    __slots__ = ("stats",)
+
+    def __init__(self, stats: ProfileStats):
+        super().__init__()
+        self.stats: ProfileStats = stats
+
+    def sift_up(self, node_index: int):
+        self.stats.counters["sift_up"] += 1
+        super().sift_up(node_index)
+
+    def sift_down(self, node_index: int):
+        self.stats.counters["sift_down"] += 1
+        super().sift_down(node_index)
+
+    def pop(self) -> int:
+        with self.stats.phase("pop"):
+            return super().pop()
+
+    def update(self, node_index: int, new_key: int):
+        self.stats.counters["decrease_key"] += 1
+        with self.stats.phase("decrease_key"):
+            super().update(node_index, new_key)
@@ -0,0 +1,154 @@
+from array import array
+from dataclasses import dataclass
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from datastructure.graph import Graph
+
+
+@dataclass
+class SpanningTree:
+    """
+    A class for represent the result of an MST algorithm without building a Graph:
+    the edges are three aligned columns and the total weight is computed once.
+    to_graph builds the Graph only when it is needed.
+
+    Attributes
+    __________
+    sources : np.ndarray
+        first endpoint of each edge
+    targets : np.ndarray
+        second endpoint of each edge
+    weights : np.ndarray
+        weight of each edge
+    total_weight : int
+        sum of the weights of the edges
+    """
+    __slots__ = ("sources", "targets", "weights", "total_weight")
+
+    sources: np.ndarray
+    targets: np.ndarray
+    weights: np.ndarray
+    total_weight: int
+
+    @property
+    def m(self) -> int:
+        return len(self.weights)
+
+    def sum_weights(self) -> int:
+        """
+        Returns the sum of all edges, like Graph.sum_weights
+
+        Returns
+        -------
+        int
+            sum of all edges
+        """
+        return self.total_weight
+
+    def get_edge_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the edges of the tree as three aligned columns
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            first endpoints, second endpoints and weights of the edges
+        """
+        return self.sources, self.targets, self.weights
+
+    def to_graph(self) -> Graph:
+        """
+        Returns the tree as a Graph
+
+        Returns
+        -------
+        Graph
+            the graph with the edges of the tree
+        """
+        graph: Graph = Graph()
+        for a, b, weight in zip(self.sources.tolist(), self.targets.tolist(), self.weights.tolist()):
+            graph.add_edge(a, b, weight)
+        return graph
+
+
+# What the MST algorithms return, depending on their as_graph argument
+MST = Union[Graph, SpanningTree]
+
+
+class TreeBuilder:
+    """
+    Collects the edges accepted by an MST algorithm in typed arrays, without an object per edge
+
+    Methods
+    -------
+    def add_edge(self, a: int, b: int, weight: int) -> None:
+        add an edge to the tree
+    def build(self) -> SpanningTree:
+        the tree with the edges added so far
+    """
+    __slots__ = ("sources", "targets", "weights")
+
+    def __init__(self):
+        self.sources: array = array('i')
+        self.targets: array = array('i')
+        self.weights: array = array('i')
+
+    def add_edge(self, a: int, b: int, weight: int) -> None:
+        self.sources.append(a)
+        self.targets.append(b)
+        self.weights.append(weight)
+
+    def build(self) -> SpanningTree:
+        return tree_from_columns(np.frombuffer(self.sources, dtype=np.int32),
+                                 np.frombuffer(self.targets, dtype=np.int32),
+                                 np.frombuffer(self.weights, dtype=np.int32))
+
+
+def tree_from_columns(sources: np.ndarray, targets: np.ndarray, weights: np.ndarray) -> SpanningTree:
+    """
+    Build a SpanningTree from three aligned columns of edges
+
+    Parameters
+    ----------
+    sources : np.ndarray
+        first endpoints of the edges
+    targets : np.ndarray
+        second endpoints of the edges
+    weights : np.ndarray
+        weights of the edges
+
+    Returns
+    -------
+    SpanningTree
+        the tree with the given edges
+    """
+    return SpanningTree(sources, targets, weights, int(weights.sum(dtype=np.int64)))
+
+
+def tree_from_parents(names: List[int], parents: List[int], keys: List[int]) -> SpanningTree:
+    """
+    Build a SpanningTree from the parent of each node, as found by Prim
+
+    Parameters
+    ----------
+    names : List[int]
+        names of the nodes
+    parents : List[int]
+        parent of each node (indexed by name), -1 for the root
+    keys : List[int]
+        weight of the edge to the parent of each node (indexed by name)
+
+    Returns
+    -------
+    SpanningTree
+        the tree with an edge from every node, but the root, to its parent
+    """
+    nodes: np.ndarray = np.array(names, dtype=np.int32)
+    node_parents: np.ndarray = np.array(parents, dtype=np.int32)[nodes]
+    # the keys of the nodes never reached are still maxsize, but they have no parent
+    node_keys: np.ndarray = np.array(keys, dtype=np.int64)[nodes]
+
+    reached: np.ndarray = node_parents != -1
+    return tree_from_columns(nodes[reached], node_parents[reached], node_keys[reached].astype(np.int32))
@@ -0,0 +1,182 @@
+from argparse import ArgumentParser
+from typing import Optional, Tuple
+
+import numpy as np
+
+from parser import ColumnContent, write_cache
+
+STRUCTURES = ("random", "grid", "power_law", "complete")
+DISTRIBUTIONS = ("uniform", "normal", "exponential")
+
+# Exponent of the degree distribution of the power law graphs
+POWER_LAW_EXPONENT: float = 2.5
+
+
+def generate_graph(n: int, m: Optional[int] = None, density: float = 0.0, structure: str = "random",
+                   distribution: str = "uniform", min_weight: int = 1, max_weight: int = 9999,
+                   seed: int = 0) -> ColumnContent:
+    """
+    Returns a connected random graph, without self loops or parallel edges, with the nodes
+    named from 1 to n. The same arguments always give the same graph.
+    Every node but the first is connected to a smaller one and the edges are sorted by their
+    greater endpoint, so the nodes appear in increasing order, as in the stanford-algs files.
+
+    Parameters
+    ----------
+    n : int
+        number of nodes
+    m : Optional[int]
+        number of edges, at least n - 1 (ignored by grid and complete)
+    density : float
+        fraction of all the possible edges, used when m is not given
+    structure : str
+        random: a random spanning tree plus uniform random edges
+        grid: the nodes on an almost square grid, each one connected to the right and down ones
+        power_law: a spanning tree and edges attached preferentially to the hubs
+        complete: all the possible edges
+    distribution : str
+        distribution of the weights: uniform, normal or exponential, clipped to the limits
+    min_weight : int
+        minimum weight of an edge
+    max_weight : int
+        maximum weight of an edge
+    seed : int
+        seed of the random generator
+
+    Returns
+    -------
+    ColumnContent
+        the edges of the graph
+    """
+    if structure not in STRUCTURES:
+        raise ValueError("Unknown structure: " + structure)
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("Unknown distribution: " + distribution)
+
+    rng: np.random.Generator = np.random.default_rng(seed)
+    pairs: int = n * (n - 1) // 2
+    if m is None:
+        m = round(density * pairs)
+    m = min(max(m, n - 1), pairs)
+
+    if structure == "grid":
+        sources, targets = _grid_edges(n)
+    elif structure == "complete":
+        sources, targets = np.triu_indices(n, 1)
+    else:
+        # a random spanning tree keeps the graph connected: every node after the first one
+        # is attached to a smaller one
+        children: np.ndarray = np.arange(1, n)
+        if structure == "random":
+            parents: np.ndarray = rng.integers(0, children)
+        else:
+            # u^2 favours the first nodes, that become the hubs
+            parents = (children * rng.random(n - 1) ** 2).astype(np.int64)
+
+        sources, targets = _extra_edges(rng, n, m, pairs, structure, parents, children)
+
+    sources, targets = np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64)
+    order: np.ndarray = np.lexsort((sources, targets))
+    sources, targets = sources[order], targets[order]
+    weights: np.ndarray = _weights(rng, len(sources), distribution, min_weight, max_weight)
+
+    # names from 1 to n, as in the stanford-algs files
+    return ColumnContent(n=n, m=len(sources), sources=(sources + 1).astype(np.int32),
+                         targets=(targets + 1).astype(np.int32), weights=weights)
+
+
+def _grid_edges(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    columns: int = max(int(np.ceil(np.sqrt(n))), 1)
+    nodes: np.ndarray = np.arange(n)
+
+    # right neighbour in the same row, and the node below (the last row can be partial)
+    right: np.ndarray = nodes[(nodes % columns != columns - 1) & (nodes + 1 < n)]
+    down: np.ndarray = nodes[nodes + columns < n]
+    return np.concatenate((right, down)), np.concatenate((right + 1, down + columns))
+
+
+def _extra_edges(rng: np.random.Generator, n: int, m: int, pairs: int, structure: str,
+                 tree_sources: np.ndarray, tree_targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # every edge is a key a * n + b with a < b, so the duplicates are found with np.setdiff1d
+    keys: np.ndarray = tree_sources * n + tree_targets
+
+    if structure == "power_law":
+        # Chung-Lu: the endpoints are drawn with probability proportional to the expected degree
+        expected_degree: np.ndarray = (np.arange(n) + 1.0) ** (-1 / (POWER_LAW_EXPONENT - 1))
+        probabilities: np.ndarray = expected_degree / expected_degree.sum()
+    else:
+        probabilities = None
+
+    # draw more edges than missing, the self loops and the duplicates are dropped
+    while len(keys) < m:
+        missing: int = m - len(keys)
+        # the more edges are taken, the more of the drawn ones are duplicates
+        size: int = int(missing * 1.1 / max(1 - len(keys) / pairs, 0.01)) + 16
+        a: np.ndarray = rng.choice(n, size, p=probabilities)
+        b: np.ndarray = rng.choice(n, size, p=probabilities)
+        a, b = a[a != b], b[a != b]
+        new_keys: np.ndarray = np.setdiff1d(np.minimum(a, b) * n + np.maximum(a, b), keys)
+        # np.setdiff1d sorts, keep a random subset of the new edges
+        new_keys = rng.permutation(new_keys)[:missing]
+        keys = np.concatenate((keys, new_keys))
+
+    return keys // n, keys % n
+
+
+def _weights(rng: np.random.Generator, size: int, distribution: str, min_weight: int, max_weight: int) -> np.ndarray:
+    if distribution == "uniform":
+        weights: np.ndarray = rng.integers(min_weight, max_weight + 1, size)
+    elif distribution == "normal":
+        weights = np.rint(rng.normal((min_weight + max_weight) / 2, (max_weight - min_weight) / 6, size))
+    else:
+        weights = np.rint(min_weight + rng.exponential((max_weight - min_weight) / 5, size))
+    return np.clip(weights, min_weight, max_weight).astype(np.int32)
+
+
+def write_graph(path: str, content: ColumnContent, binary: bool = True) -> None:
+    """
+    Write the graph in the stanford-algs format and, if binary, its binary cache next to it
+
+    Parameters
+    ----------
+    path : str
+        path of the text file
+    content : ColumnContent
+        the edges of the graph
+    binary : bool
+        write also the binary cache read by parser.load_columns
+    """
+    with open(path, "w") as file:
+        file.write("%d %d\n" % (content.n, content.m))
+        np.savetxt(file, np.column_stack((content.sources, content.targets, content.weights)), fmt="%d")
+
+    if binary:
+        write_cache(path, content)
+
+
+def main():
+    # e.g.: python generator.py dataset_large/input_grid_1000000.txt -n 1000000 --structure grid --seed 1
+    # The min-cut graphs have the same text and binary formats, so 03-MCP uses this generator too, e.g.:
+    # cd 03-MCP && python ../01-MST/generator.py dataset_large/input_random_2000.txt -n 2000 --density 0.01
+    argument_parser = ArgumentParser(description="Generate a connected random graph in the stanford-algs format")
+    argument_parser.add_argument("path", help="path of the text file to write")
+    argument_parser.add_argument("-n", type=int, required=True, help="number of nodes")
+    argument_parser.add_argument("-m", type=int, default=None, help="number of edges")
+    argument_parser.add_argument("--density", type=float, default=0.0,
+                                 help="fraction of all the possible edges, if -m is not given")
+    argument_parser.add_argument("--structure", choices=STRUCTURES, default="random")
+    argument_parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform")
+    argument_parser.add_argument("--min-weight", type=int, default=1)
+    argument_parser.add_argument("--max-weight", type=int, default=9999)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--no-binary", action="store_true", help="do not write the binary cache")
+    arguments = argument_parser.parse_args()
+
+    content: ColumnContent = generate_graph(arguments.n, arguments.m, arguments.density, arguments.structure,
+                                            arguments.distribution, arguments.min_weight, arguments.max_weight,
+                                            arguments.seed)
+    write_graph(arguments.path, content, not arguments.no_binary)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,25 +2,47 @@ from sys import argv
 
 from algorithms.kruskal_union_find import kruskal_union_find
 from algorithms.naive_kruskal import naive_kruskal
-from analyzer import run_analysis, print_results, mlogn, mn, compare_plot
+from analyzer import run_analysis, print_results, mlogn, mn, compare_plot, measure_time_parallel, \
+    save_benchmark
 from algorithms.prim import prim
 
 
 def main():
-    if len(argv) == 2 and argv[1] == "-r":
+    # -a: adaptive number of calls for every graph instead of num_calls
+    adaptive = "-a" in argv[1:]
+    # -m: measure also the memory used to load every graph and by the algorithms
+    memory = "-m" in argv[1:]
+
+    if "-r" in argv[1:]:
         print_results()
+    elif "-p" in argv[1:]:
+        # all the (file, algorithm) pairs at once on a pool of processes
+        num_calls = 100000
+        prim_analysis, kruskal_union_find_analysis, naive_kruskal_analysis = measure_time_parallel(
+            [(prim, False), (kruskal_union_find, False), (naive_kruskal, True)], num_calls, adaptive=adaptive,
+            memory=memory)
+
+        run_analysis(prim, mlogn, "Prim", analysis=prim_analysis)
+        run_analysis(kruskal_union_find, mlogn, "Kruskal_union_find", analysis=kruskal_union_find_analysis)
+        run_analysis(naive_kruskal, mn, "Kruskal_naive", analysis=naive_kruskal_analysis)
+
+        save_benchmark("benchmark", prim_analysis, kruskal_union_find_analysis, naive_kruskal_analysis)
+        compare_plot(prim_analysis, kruskal_union_find_analysis, naive_kruskal_analysis)
     else:
 
         num_calls = 100000
         print("Prim")
-        prim_analysis = run_analysis(prim, mlogn, "Prim", num_calls)
+        prim_analysis = run_analysis(prim, mlogn, "Prim", num_calls, adaptive=adaptive, memory=memory)
 
         print("Kruskal union find")
-        kruskal_union_find_analysis = run_analysis(kruskal_union_find, mlogn, "Kruskal_union_find", num_calls)
+        kruskal_union_find_analysis = run_analysis(kruskal_union_find, mlogn, "Kruskal_union_find", num_calls,
+                                                   adaptive=adaptive, memory=memory)
 
         print("Kruskal naive")
-        naive_kruskal_analysis = run_analysis(naive_kruskal, mn, "Kruskal_naive", num_calls, True)
+        naive_kruskal_analysis = run_analysis(naive_kruskal, mn, "Kruskal_naive", num_calls, True, adaptive=adaptive,
+                                              memory=memory)
 
+        save_benchmark("benchmark", prim_analysis, kruskal_union_find_analysis, naive_kruskal_analysis)
         compare_plot(prim_analysis, kruskal_union_find_analysis, naive_kruskal_analysis)
 
 
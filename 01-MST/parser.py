@@ -1,5 +1,17 @@
+import os
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Binary cache format: a header of HEADER_FIELDS int64 values
+# (magic, version, n, m, number of edges, source mtime in ns, source size, reserved)
+# followed by the sources, targets and weights columns packed as int32
+CACHE_EXTENSION = ".bin"
+CACHE_MAGIC = 0x4847534D  # "MSGH"
+CACHE_VERSION = 1
+HEADER_FIELDS = 8
+HEADER_SIZE = HEADER_FIELDS * np.dtype(np.int64).itemsize
 
 @dataclass
 class Content:
@@ -61,3 +73,170 @@ def parse(path: str) -> Content:
             content.list_triple.append(_triple)
 
     return content
+
+
+@dataclass
+class ColumnContent:
+    """
+    A class for represent the content of a file after it is parsed in bulk.
+    Edges are stored as three aligned NumPy columns instead of a list of triples.
+
+    Attributes
+    ----------
+    n: int
+        number of nodes inside the graph described in the file
+    m: int
+        number of edges inside the graph described in the file
+    sources: np.ndarray
+        origin node of each edge
+    targets: np.ndarray
+        target node of each edge
+    weights: np.ndarray
+        weight of each edge
+    """
+    n: int
+    m: int
+    sources: np.ndarray
+    targets: np.ndarray
+    weights: np.ndarray
+
+
+def parse_columns(path: str) -> ColumnContent:
+    """
+    Parse the content of a file representing a graph in a single pass, without
+    creating a Python object for each edge
+
+    Parameters
+    ----------
+    path : str
+        the relative or absolute path to the input source file
+
+    Returns
+    -------
+    ColumnContent
+        a object of type ColumnContent representing the content of the parsed file
+    """
+    # The whole file is a sequence of whitespace separated integers:
+    # "n m" followed by m triples
+    values: np.ndarray = np.fromfile(path, dtype=np.int64, sep=" ")
+    n, m = int(values[0]), int(values[1])
+    triples: np.ndarray = values[2:].reshape(-1, 3)
+
+    return ColumnContent(n, m,
+                         triples[:, 0].astype(np.int32),
+                         triples[:, 1].astype(np.int32),
+                         triples[:, 2].astype(np.int32))
+
+
+def cache_path(path: str) -> str:
+    """
+    Returns the path of the binary cache of a graph file, next to the file itself
+
+    Parameters
+    ----------
+    path : str
+        the relative or absolute path to the input source file
+
+    Returns
+    -------
+    str
+        the path of the binary cache
+    """
+    return os.path.splitext(path)[0] + CACHE_EXTENSION
+
+
+def write_cache(path: str, content: ColumnContent) -> None:
+    """
+    Write the columns of a parsed file in the binary cache format
+
+    Parameters
+    ----------
+    path : str
+        the relative or absolute path to the input source file
+    content : ColumnContent
+        the parsed content of the source file
+    """
+    stat = os.stat(path)
+    header = np.array([CACHE_MAGIC, CACHE_VERSION, content.n, content.m, len(content.sources),
+                       stat.st_mtime_ns, stat.st_size, 0], dtype=np.int64)
+    columns = np.vstack((content.sources, content.targets, content.weights)).astype(np.int32)
+
+    # write on a temporary file and then rename it, so a reader never sees a partial cache
+    # one temporary file per process, the benchmark workers can write the same cache together
+    temporary_path: str = cache_path(path) + "." + str(os.getpid()) + ".tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(header.tobytes())
+            file.write(columns.tobytes())
+        os.replace(temporary_path, cache_path(path))
+    finally:
+        # after a failed write or rename the temporary file must not be left behind
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+def read_cache(path: str) -> Optional[ColumnContent]:
+    """
+    Memory-map the binary cache of a graph file, if it exists and it is still valid
+    (the source file has the same modification time and size of when the cache was written)
+
+    Parameters
+    ----------
+    path : str
+        the relative or absolute path to the input source file
+
+    Returns
+    -------
+    Optional[ColumnContent]
+        the content of the source file with memory-mapped columns, None if there is no valid cache
+    """
+    binary_path: str = cache_path(path)
+    if not os.path.exists(binary_path) or os.path.getsize(binary_path) < HEADER_SIZE:
+        return None
+
+    header = np.fromfile(binary_path, dtype=np.int64, count=HEADER_FIELDS)
+    magic, version, n, m, count, mtime, size, _ = header.tolist()
+    stat = os.stat(path)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or \
+            mtime != stat.st_mtime_ns or size != stat.st_size:
+        return None
+    if os.path.getsize(binary_path) != HEADER_SIZE + 3 * count * np.dtype(np.int32).itemsize:
+        return None
+
+    if count == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return ColumnContent(n, m, empty, empty, empty)
+
+    columns = np.memmap(binary_path, dtype=np.int32, mode="r", offset=HEADER_SIZE, shape=(3, count))
+    return ColumnContent(n, m, columns[0], columns[1], columns[2])
+
+
+def load_columns(path: str, use_cache: bool = True) -> ColumnContent:
+    """
+    Returns the content of a graph file as columns, using the binary cache next to the file
+    when it is valid and writing it otherwise
+
+    Parameters
+    ----------
+    path : str
+        the relative or absolute path to the input source file
+    use_cache : bool
+        if False the file is always parsed and no cache is written
+
+    Returns
+    -------
+    ColumnContent
+        a object of type ColumnContent representing the content of the file
+    """
+    if not use_cache:
+        return parse_columns(path)
+
+    content: Optional[ColumnContent] = read_cache(path)
+    if content is None:
+        content = parse_columns(path)
+        try:
+            write_cache(path, content)
+        except OSError:
+            # the cache is only an optimization, a read-only dataset still works
+            pass
+    return content
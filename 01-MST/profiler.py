@@ -0,0 +1,125 @@
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from time import perf_counter_ns
+from typing import Callable, ContextManager, DefaultDict, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ProfileStats:
+    """
+    A class to collect the time and the counts of the phases of an algorithm
+
+    Attributes
+    __________
+    times : DefaultDict[str, int]
+        time spent in each phase (ns)
+    calls : DefaultDict[str, int]
+        number of times each phase has been entered
+    counters : DefaultDict[str, int]
+        counts of the events of the algorithm (e.g. finds, sifts, visited nodes)
+
+    Methods
+    -------
+    def phase(self, name: str) -> ContextManager[None]:
+        add the time of the block to the phase
+    def timed(self, name: str, function: Callable[..., T]) -> Callable[..., T]:
+        wrap the function, adding the time of every call to the phase
+    def timed_iter(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        add the time spent to produce every item to the phase
+    def count(self, name: str, value: int = 1) -> None:
+        increment a counter
+    def report(self) -> str:
+        a table of the phases and of the counters
+    """
+
+    def __init__(self):
+        self.times: DefaultDict[str, int] = defaultdict(int)
+        self.calls: DefaultDict[str, int] = defaultdict(int)
+        self.counters: DefaultDict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start_time = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.times[name] += perf_counter_ns() - start_time
+            self.calls[name] += 1
+
+    def timed(self, name: str, function: Callable[..., T]) -> Callable[..., T]:
+        times, calls = self.times, self.calls
+
+        def wrapper(*args, **kwargs) -> T:
+            start_time = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                times[name] += perf_counter_ns() - start_time
+                calls[name] += 1
+
+        return wrapper
+
+    def timed_iter(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        iterator: Iterator[T] = iter(iterable)
+        while True:
+            start_time = perf_counter_ns()
+            try:
+                item: T = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.times[name] += perf_counter_ns() - start_time
+                self.calls[name] += 1
+            yield item
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] += value
+
+    def report(self) -> str:
+        lines: List[str] = ["Phase\t\t\tCalls\t\tTime(ms)"]
+        for name, time in self.times.items():
+            lines.append("%-16s\t%d\t\t%.3f" % (name, self.calls[name], time / 10 ** 6))
+        lines.append("Counter\t\t\tValue")
+        for name, value in self.counters.items():
+            lines.append("%-16s\t%d" % (name, value))
+        return "\n".join(lines)
+
+
+# The stats of the innermost profile block, None when profiling is disabled
+_active: Optional[ProfileStats] = None
+
+
+@contextmanager
+def profile() -> Iterator[ProfileStats]:
+    """
+    Enable the profiling of the MST algorithms called inside the block, e.g.:
+
+        with profile() as stats:
+            prim(graph)
+        print(stats.report())
+
+    The algorithms look for the stats only once when they start, and without an active
+    block they run exactly the code they run without the profiler.
+
+    Returns
+    -------
+    Iterator[ProfileStats]
+        the stats filled by the algorithms called in the block
+    """
+    global _active
+    previous: Optional[ProfileStats] = _active
+    _active = ProfileStats()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+def active() -> Optional[ProfileStats]:
+    return _active
+
+
+def phase(stats: Optional[ProfileStats], name: str) -> ContextManager[None]:
+    # for the blocks outside the hot loops, that can be profiled or not
+    return nullcontext() if stats is None else stats.phase(name)
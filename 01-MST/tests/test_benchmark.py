@@ -0,0 +1,84 @@
+import csv
+import math
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+from benchmark import CSV_HEADER, BenchmarkResult, Timing, load_results, save_results
+from memory import MemoryUsage
+
+
+class TestTiming(TestCase):
+    def test_outliers(self):
+        # Q1 = 11.25 and Q3 = 15.75, so the fences are 4.5 and 22.5
+        timing: Timing = Timing(samples=[16, 10, 100, 12, 11, 14, 13, 15], repetitions=1)
+
+        self.assertEqual([16, 10, 12, 11, 14, 13, 15], timing.kept)
+        self.assertEqual(1, timing.outliers)
+
+    def test_outliers_both_sides(self):
+        timing: Timing = Timing(samples=[-50, 10, 11, 12, 13, 14, 15, 16, 100], repetitions=1)
+
+        self.assertEqual([10, 11, 12, 13, 14, 15, 16], timing.kept)
+        self.assertEqual(2, timing.outliers)
+
+    def test_no_rejection_with_few_samples(self):
+        timing: Timing = Timing(samples=[1, 100, 1000], repetitions=1)
+
+        self.assertEqual([1, 100, 1000], timing.kept)
+        self.assertEqual(0, timing.outliers)
+
+    def test_statistics(self):
+        timing: Timing = Timing(samples=[16, 10, 100, 12, 11, 14, 13, 15], repetitions=1)
+
+        # on the kept samples only
+        self.assertEqual(10, timing.min)
+        self.assertEqual(13, timing.median)
+        self.assertEqual(16, timing.p95)
+        self.assertAlmostEqual(math.sqrt(28 / 6), timing.stddev)
+
+    def test_statistics_single_sample(self):
+        timing: Timing = Timing(samples=[5.0], repetitions=3)
+
+        self.assertEqual(5.0, timing.min)
+        self.assertEqual(5.0, timing.median)
+        self.assertEqual(5.0, timing.p95)
+        self.assertEqual(0.0, timing.stddev)
+
+
+class TestSaveResults(TestCase):
+    def setUp(self):
+        self.results = [
+            BenchmarkResult(file="input_random_1_10.txt", algorithm="prim", n=10, m=9,
+                            timing=Timing(samples=[16, 10, 100, 12, 11, 14, 13, 15], repetitions=100,
+                                          warmup=[20.0, 18.5]),
+                            construction_memory=MemoryUsage(rss_peak=4096, traced_peak=1024),
+                            run_memory=MemoryUsage(rss_peak=None, traced_peak=512)),
+            BenchmarkResult(file="input_random_2_10.txt", algorithm="naive_kruskal", n=10, m=11,
+                            timing=Timing(samples=[2500.5], repetitions=1))]
+
+    def test_json_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "benchmark")
+            save_results(path, self.results)
+
+            self.assertEqual(self.results, load_results(path + ".json"))
+
+    def test_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "benchmark")
+            save_results(path, self.results)
+
+            with open(path + ".csv", newline="") as file:
+                rows = list(csv.reader(file))
+
+        self.assertEqual(CSV_HEADER, rows[0])
+        self.assertEqual(["input_random_1_10.txt", "prim", "10", "9", "100", "8", "1", "10", "13", "16", "2.16",
+                          "4096", "1024", "", "512"], rows[1])
+        self.assertEqual(["input_random_2_10.txt", "naive_kruskal", "10", "11", "1", "1", "0", "2500.5", "2500.5",
+                          "2500.5", "0.0", "", "", "", ""], rows[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
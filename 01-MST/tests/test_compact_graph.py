@@ -0,0 +1,53 @@
+import unittest
+from unittest import TestCase
+from parameterized import parameterized
+from datastructure.compact_graph import CompactGraph, compact_graph_from_file
+from datastructure.graph import Graph, graph_from_file
+from algorithms.kruskal_union_find import kruskal_union_find
+from algorithms.prim import prim
+from mst_dataset import FILES, expected_result, input_path
+
+
+class TestCompactGraph(TestCase):
+    @parameterized.expand(FILES)
+    def test_prim(self, file):
+        graph: CompactGraph = compact_graph_from_file(input_path(file))
+
+        mst: Graph = prim(graph, 0)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+    @parameterized.expand(FILES)
+    def test_kruskal_union_find(self, file):
+        graph: CompactGraph = compact_graph_from_file(input_path(file))
+
+        mst: Graph = kruskal_union_find(graph)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+    @parameterized.expand(FILES)
+    def test_weights(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+        compact: CompactGraph = compact_graph_from_file(input_path(file))
+
+        self.assertEqual(graph.n, compact.n)
+        self.assertEqual(graph.m, compact.m)
+        for (a, b), weight in graph.get_all_edges().items():
+            self.assertEqual(weight, compact.get_weight(compact.get_id(a), compact.get_id(b)))
+            self.assertEqual(weight, compact.get_weight(compact.get_id(b), compact.get_id(a)))
+        self.assertIsNone(compact.get_id(0))
+
+    @parameterized.expand(FILES)
+    def test_relabel(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+        compact: CompactGraph = compact_graph_from_file(input_path(file))
+
+        mst: Graph = compact.relabel(kruskal_union_find(compact))
+
+        self.assertEqual(set(graph.get_all_nodes()), set(mst.get_all_nodes()))
+        for (a, b), weight in mst.get_all_edges().items():
+            self.assertEqual(graph.get_weight(a, b), weight)
+
+
+if __name__ == '__main__':
+    unittest.main()
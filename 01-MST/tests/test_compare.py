@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import List
+from unittest import TestCase
+
+import compare
+from benchmark import BenchmarkResult, Timing, compare_results, mann_whitney, save_results, unmatched_results
+
+FAST: List[float] = [100.0, 101.0, 102.0, 103.0, 104.0]
+SLOW: List[float] = [200.0, 201.0, 202.0, 203.0, 204.0]
+
+
+def result(file: str, samples: List[float], algorithm: str = "prim") -> BenchmarkResult:
+    return BenchmarkResult(file=file, algorithm=algorithm, n=10, m=20, timing=Timing(samples=samples, repetitions=1))
+
+
+class TestMannWhitney(TestCase):
+    def test_exact(self):
+        self.assertAlmostEqual(2 / 70, mann_whitney([1, 2, 3, 4], [5, 6, 7, 8]))
+        self.assertAlmostEqual(2 / 70, mann_whitney([5, 6, 7, 8], [1, 2, 3, 4]))
+        self.assertAlmostEqual(1 / 3, mann_whitney([1, 2], [3, 4]))
+        self.assertAlmostEqual(48 / 70, mann_whitney([1, 3, 5, 7], [2, 4, 6, 8]))
+        self.assertAlmostEqual(1.0, mann_whitney([1, 4, 5, 8], [2, 3, 6, 7]))
+
+    def test_normal_approximation_with_ties(self):
+        # U = 0, variance 9 / 12 * (7 - 12 / 30)
+        self.assertAlmostEqual(0.0431, mann_whitney([1, 1, 2], [3, 3, 4]), places=4)
+        self.assertEqual(1.0, mann_whitney([5, 5, 5], [5, 5, 5]))
+
+    def test_normal_approximation_many_samples(self):
+        self.assertLess(mann_whitney(list(range(25)), list(range(25, 50))), 1e-6)
+        self.assertGreater(mann_whitney(list(range(0, 50, 2)), list(range(1, 50, 2))), 0.5)
+
+
+class TestCompareResults(TestCase):
+    def test_compare_results(self):
+        baseline = [result("a.txt", FAST), result("b.txt", FAST), result("c.txt", [100.0])]
+        candidate = [result("c.txt", [300.0]), result("b.txt", FAST), result("a.txt", SLOW), result("d.txt", FAST)]
+        comparisons = compare_results(baseline, candidate)
+
+        # in the order of the candidate, without d.txt
+        self.assertEqual(["c.txt", "b.txt", "a.txt"], [comparison.file for comparison in comparisons])
+        self.assertTrue(comparisons[0].inconclusive)
+        self.assertFalse(comparisons[0].is_regression(0.05, 0.05))
+
+        self.assertEqual(1.0, comparisons[1].ratio)
+        self.assertFalse(comparisons[1].is_regression(0.05, 0.05))
+
+        self.assertEqual(202.0 / 102.0, comparisons[2].ratio)
+        self.assertLess(comparisons[2].p_value, 0.05)
+        self.assertTrue(comparisons[2].is_regression(0.05, 0.05))
+        self.assertFalse(comparisons[2].is_regression(1.5, 0.05))
+
+    def test_unmatched_results(self):
+        baseline = [result("a.txt", FAST), result("b.txt", FAST), result("a.txt", FAST, "kruskal")]
+        candidate = [result("a.txt", FAST), result("c.txt", FAST)]
+        self.assertEqual(([("b.txt", "prim"), ("a.txt", "kruskal")], [("c.txt", "prim")]),
+                         unmatched_results(baseline, candidate))
+
+
+class TestCompareExitCode(TestCase):
+    def exit_code(self, baseline: List[BenchmarkResult], candidate: List[BenchmarkResult], *options: str) -> int:
+        with tempfile.TemporaryDirectory() as directory:
+            save_results(os.path.join(directory, "baseline"), baseline)
+            save_results(os.path.join(directory, "candidate"), candidate)
+            with self.assertRaises(SystemExit) as context, redirect_stdout(io.StringIO()):
+                compare.main([os.path.join(directory, "baseline.json"), os.path.join(directory, "candidate.json"),
+                              *options])
+        return context.exception.code
+
+    def test_no_regression(self):
+        self.assertEqual(0, self.exit_code([result("a.txt", SLOW)], [result("a.txt", FAST)]))
+
+    def test_regression(self):
+        self.assertEqual(1, self.exit_code([result("a.txt", FAST)], [result("a.txt", SLOW)]))
+        self.assertEqual(1, self.exit_code([result("a.txt", FAST)], [result("a.txt", SLOW)], "--allow-inconclusive"))
+        self.assertEqual(0, self.exit_code([result("a.txt", FAST)], [result("a.txt", SLOW)], "--threshold", "1.5"))
+
+    def test_inconclusive(self):
+        # a single sample per run, as main.py without -a saves
+        self.assertEqual(1, self.exit_code([result("a.txt", [100.0])], [result("a.txt", [100.0])]))
+        self.assertEqual(0, self.exit_code([result("a.txt", [100.0])], [result("a.txt", [100.0])],
+                                           "--allow-inconclusive"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,9 @@ from parameterized import parameterized
 from typing import List, TextIO
 from datastructure.graph import Graph, graph_from_file
 from algorithms.kruskal_union_find import kruskal_union_find
+from datastructure.csr_graph import CSRGraph, csr_from_graph
+from datastructure.spanning_tree import SpanningTree
+from mst_dataset import FILES, expected_result, input_path
 
 
 class TestKruskalUnionFind(TestCase):
@@ -31,6 +34,24 @@ class TestKruskalUnionFind(TestCase):
 
         self.assertEqual(th_result, result)
 
+    @parameterized.expand(FILES)
+    def test_kuskal_union_find_csr(self, file):
+        graph: CSRGraph = csr_from_graph(graph_from_file(input_path(file)))
+
+        mst: Graph = kruskal_union_find(graph)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+    @parameterized.expand(FILES)
+    def test_kuskal_union_find_tree(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        mst: SpanningTree = kruskal_union_find(graph, as_graph=False)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+        self.assertEqual(graph.n - 1, mst.m)
+        self.assertEqual(expected_result(file), mst.to_graph().sum_weights())
+
 
 if __name__ == '__main__':
     unittest.main()
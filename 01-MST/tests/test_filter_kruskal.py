@@ -0,0 +1,31 @@
+import unittest
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from algorithms.filter_kruskal import filter_kruskal
+from datastructure.csr_graph import CSRGraph, csr_from_graph
+from datastructure.graph import Graph, graph_from_file
+from mst_dataset import FILES, expected_result, input_path
+
+
+class TestFilterKruskal(TestCase):
+    @parameterized.expand(FILES)
+    def test_filter_kruskal(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        mst: Graph = filter_kruskal(graph)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+    @parameterized.expand(FILES)
+    def test_filter_kruskal_csr(self, file):
+        graph: CSRGraph = csr_from_graph(graph_from_file(input_path(file)))
+
+        mst: Graph = filter_kruskal(graph)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+
+if __name__ == '__main__':
+    unittest.main()
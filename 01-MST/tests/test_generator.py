@@ -0,0 +1,41 @@
+import unittest
+from unittest import TestCase
+from parameterized import parameterized
+from datastructure.csr_graph import CSRGraph, csr_from_columns
+from datastructure.graph import Graph
+from algorithms.kruskal_union_find import kruskal_union_find
+from algorithms.prim import prim
+from generator import generate_graph
+from parser import ColumnContent
+
+GRAPHS = [("random", 1000, 5000), ("random", 200, 19000), ("grid", 1001, None), ("power_law", 1000, 5000),
+          ("complete", 100, None)]
+
+
+class TestGenerator(TestCase):
+    @parameterized.expand(GRAPHS)
+    def test_generate_graph(self, structure, n, m):
+        content: ColumnContent = generate_graph(n, m, structure=structure, seed=1)
+        graph: CSRGraph = csr_from_columns(content.sources, content.targets, content.weights)
+
+        # no self loops or parallel edges
+        self.assertEqual(content.m, graph.m)
+        self.assertEqual(n, graph.n)
+
+        # connected: the spanning tree reaches every node
+        mst: Graph = kruskal_union_find(graph)
+        self.assertEqual(n - 1, len(mst.get_all_edges()))
+        self.assertEqual(prim(graph).sum_weights(), mst.sum_weights())
+
+    @parameterized.expand(GRAPHS)
+    def test_generate_graph_seed(self, structure, n, m):
+        first: ColumnContent = generate_graph(n, m, structure=structure, seed=1)
+        second: ColumnContent = generate_graph(n, m, structure=structure, seed=1)
+
+        self.assertEqual(first.sources.tolist(), second.sources.tolist())
+        self.assertEqual(first.targets.tolist(), second.targets.tolist())
+        self.assertEqual(first.weights.tolist(), second.weights.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
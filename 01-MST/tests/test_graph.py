@@ -0,0 +1,39 @@
+import unittest
+from unittest import TestCase
+
+from datastructure.graph import Graph
+
+
+class TestGraph(TestCase):
+    def test_add_reversed_parallel_edge(self):
+        graph: Graph = Graph()
+        graph.add_edge(1, 2, 10)
+        graph.add_edge(2, 1, 3)
+        graph.add_edge(2, 1, 7)
+
+        self.assertEqual({(1, 2): 3}, graph.get_all_edges())
+        self.assertEqual(3, graph.get_weight(1, 2))
+        self.assertEqual(3, graph.sum_weights())
+        self.assertEqual(1, graph.m)
+
+    def test_update_reversed_edge(self):
+        graph: Graph = Graph()
+        graph.add_edge(1, 2, 10)
+        graph.update_edge(2, 1, 4)
+
+        self.assertEqual({(1, 2): 4}, graph.get_all_edges())
+        self.assertEqual(4, graph.get_weight(2, 1))
+
+    def test_remove_reversed_edge(self):
+        graph: Graph = Graph()
+        graph.add_edge(1, 2, 10)
+        graph.add_edge(2, 3, 5)
+        graph.remove_edge(2, 1)
+
+        self.assertEqual({(2, 3): 5}, graph.get_all_edges())
+        self.assertIsNone(graph.get_weight(1, 2))
+        self.assertEqual({}, graph.get_node_edges(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
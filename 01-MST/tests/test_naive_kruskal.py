@@ -7,6 +7,7 @@ from parameterized import parameterized
 
 from datastructure.graph import Graph, graph_from_file
 from algorithms.naive_kruskal import naive_kruskal
+from mst_dataset import FILES, expected_result, input_path
 
 tot_time = 0
 tot_count = 0
@@ -56,6 +57,14 @@ class TestNaiveKruskal(TestCase):
 
         self.assertEqual(th_result, result)
 
+    @parameterized.expand(FILES)
+    def test_naive_kruskal_forest_check(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        mst: Graph = naive_kruskal(graph, forest_check=True, stop_early=True)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+from unittest import TestCase
+
+from parameterized import parameterized
+
+import parser
+from algorithms.parallel_boruvka import parallel_boruvka
+from datastructure.graph import Graph
+from mst_dataset import FILES, expected_result, input_path
+
+
+class TestParallelBoruvka(TestCase):
+    @parameterized.expand(FILES)
+    def test_parallel_boruvka(self, file):
+        content: parser.ColumnContent = parser.load_columns(input_path(file))
+
+        mst: Graph = parallel_boruvka(content, 2)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+
+if __name__ == '__main__':
+    unittest.main()
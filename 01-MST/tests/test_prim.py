@@ -6,6 +6,9 @@ from parameterized import parameterized
 
 from datastructure.graph import Graph, graph_from_file
 from algorithms.prim import prim
+from datastructure.csr_graph import CSRGraph, csr_from_graph
+from datastructure.spanning_tree import SpanningTree
+from mst_dataset import FILES, expected_result, input_path
 
 
 class TestPrim(TestCase):
@@ -35,6 +38,45 @@ class TestPrim(TestCase):
 
         self.assertEqual(th_result, result)
 
+    @parameterized.expand(FILES)
+    def test_prim_csr(self, file):
+        graph: CSRGraph = csr_from_graph(graph_from_file(input_path(file)))
+
+        mst: Graph = prim(graph, 1)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+    @parameterized.expand(FILES)
+    def test_prim_lazy(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        mst: Graph = prim(graph, 1, lazy=True)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+    def test_prim_lazy_disconnected(self):
+        # two components, the spanning forest weighs 6 + 11
+        graph: Graph = Graph()
+        for a, b, weight in [(1, 2, 1), (2, 3, 2), (1, 3, 5), (3, 4, 3), (5, 6, 4), (6, 7, 7), (5, 7, 10)]:
+            graph.add_edge(a, b, weight)
+
+        self.assertEqual(17, prim(graph, 1).sum_weights())
+        for starting_node in [1, 5, 100]:
+            mst: Graph = prim(graph, starting_node, lazy=True)
+            self.assertEqual(17, mst.sum_weights())
+            self.assertEqual(5, mst.m)
+            self.assertEqual(17, prim(csr_from_graph(graph), starting_node, lazy=True).sum_weights())
+
+    @parameterized.expand(FILES)
+    def test_prim_tree(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        mst: SpanningTree = prim(graph, 1, as_graph=False)
+
+        self.assertEqual(expected_result(file), mst.sum_weights())
+        self.assertEqual(graph.n - 1, mst.m)
+        self.assertEqual(expected_result(file), mst.to_graph().sum_weights())
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,62 @@
+import unittest
+from unittest import TestCase
+from parameterized import parameterized
+from datastructure.graph import Graph, graph_from_file
+from algorithms.kruskal_union_find import kruskal_union_find
+from algorithms.naive_kruskal import naive_kruskal
+from algorithms.prim import prim
+from mst_dataset import expected_result, input_path
+from profiler import ProfileStats, active, profile
+
+FILES = ['random_1_10.txt', 'random_9_40.txt', 'random_21_200.txt', 'random_33_1000.txt']
+
+
+class TestProfiler(TestCase):
+    def assert_result(self, file, mst: Graph):
+        self.assertEqual(expected_result(file), mst.sum_weights())
+
+    @parameterized.expand(FILES)
+    def test_profile_prim(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        with profile() as stats:
+            mst: Graph = prim(graph)
+
+        self.assert_result(file, mst)
+        self.assertEqual(graph.n, stats.calls["pop"])
+        self.assertEqual(stats.counters["decrease_key"], stats.calls["decrease_key"])
+
+    @parameterized.expand(FILES)
+    def test_profile_kruskal_union_find(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        with profile() as stats:
+            mst: Graph = kruskal_union_find(graph)
+
+        self.assert_result(file, mst)
+        self.assertEqual(graph.n - 1, stats.counters["union"])
+        self.assertEqual(2 * stats.calls["union_find"], stats.counters["find"])
+
+    @parameterized.expand(FILES)
+    def test_profile_naive_kruskal(self, file):
+        graph: Graph = graph_from_file(input_path(file))
+
+        with profile() as stats:
+            mst: Graph = naive_kruskal(graph, forest_check=True)
+
+        self.assert_result(file, mst)
+        self.assertEqual(len(graph.get_all_edges()), stats.calls["cycle_check"])
+        self.assertGreater(stats.counters["cycle_check_visits"], 0)
+
+    def test_profile_nested(self):
+        self.assertIsNone(active())
+        with profile() as outer:
+            with profile() as inner:
+                self.assertIs(inner, active())
+            self.assertIs(outer, active())
+        self.assertIsNone(active())
+        self.assertIsInstance(outer, ProfileStats)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,11 +23,8 @@ def kruskal_union_find(graph: Graph) -> Graph:
     for i in range(1, graph.n + 1):
         mst.nodes[i] = Node(i, 0, 0)
 
-    union_find: UnionFindSet = UnionFindSet()
-
-    # Create all the initial sets of union-find
-    for node in graph.get_all_nodes():
-        union_find.make(node)
+    # Create all the initial sets of union-find, one for each node id
+    union_find: UnionFindSet = UnionFindSet(max(graph.get_all_nodes(), default=-1) + 1)
 
     # Sort the edges of the graph
     edges: Edges = graph.get_sorted_edges()  # Dict[Tuple[int, int], int] Tuple -> int
@@ -35,9 +32,7 @@ def kruskal_union_find(graph: Graph) -> Graph:
     # Check if an edge is not inside another set, then make the union of the sets
     # and add that edge to the MST
     for edge, weight in edges.items():
-        if union_find.find(edge[0]) != union_find.find(edge[1]):
+        if union_find.union(edge[0], edge[1]):
 
             mst.update_edge(edge[0], edge[1], weight)
-
-            union_find.union(edge[0], edge[1])
     return mst
@@ -1,72 +1,69 @@
-# Union Find with union-by-size.
-from dataclasses import dataclass, field
-from typing import Dict
-
-@dataclass
-class UnionFindNode(int):
-    """
-    A dataclass to represent a single node in the parent graph.
-
-    data : int
-        the unique value associate to the node
-    parent : UnionFindNode = slef
-        the parent of the node
-    size : int = 1
-        number of nodes that are underlying of the specific node
-
-    """
-    data: int
-    parent: 'UnionFindNode' = field(init=False)
-    size: int = 1
-
-    def __post_init__(self):
-        """Function to defer the initialization of the parent node"""
-        self.parent = self
+# Union Find with union-by-size and path halving.
+from array import array
 
 
 class UnionFindSet:
     """
     A class to represent sets of node in the union-find.
+    Nodes are dense integer ids, so the parent and the size of every node are stored in
+    two arrays indexed by the id instead of one object per node.
 
-    _map : Dict[int, UnionFindNode]
-    	a key-value store for the sets of nodes
+    _parent : array
+        the parent of each node, a node is the root of its set if it is its own parent
+    _size : array
+        number of nodes that are underlying of each root
 
     Methods
     -------
     def make(self, data: int) -> None:
-        create a key 'data' in the dict and the associate UnionFindNode as item
-    def find(self, data: int) -> UnionFindNode:
-        return the root parent of the node associate to that value
-    def union(self, data1: int, data2: int) -> None:
-        create a unique sets from the two nodes associate to the given values
+        create a new set containing only 'data'
+    def find(self, data: int) -> int:
+        return the root of the set containing 'data', halving the path to it
+    def union(self, data1: int, data2: int) -> bool:
+        create a unique set from the two sets containing the given values
+    def reset(self) -> None:
+        put every node back in its own set, to reuse the instance
     """
-    _map: Dict[int, UnionFindNode] = {}
+
+    def __init__(self, size: int = 0):
+        self._parent: array = array('i', range(size))
+        self._size: array = array('i', [1]) * size
 
     def make(self, data: int) -> None:
-        # create a new set with x as its member
-        self._map[data] = UnionFindNode(data)
+        # create a new set with x as its member, growing the arrays if needed
+        if data >= len(self._parent):
+            self._size.extend(array('i', [1]) * (data + 1 - len(self._parent)))
+            self._parent.extend(range(len(self._parent), data + 1))
+        self._parent[data] = data
+        self._size[data] = 1
 
-    def find(self, data: int) -> UnionFindNode:
-        element: UnionFindNode = self._map[data]
-        parent: UnionFindNode = element.parent
-        while element != parent:
-            element = element.parent
-            parent = parent.parent
-        return element
+    def find(self, data: int) -> int:
+        parent: array = self._parent
+        while parent[data] != data:
+            # path halving: every visited node skips its parent
+            parent[data] = parent[parent[data]]
+            data = parent[data]
+        return data
 
-    def union(self, data1: int, data2: int) -> None:
+    def union(self, data1: int, data2: int) -> bool:
         # getting the two roots of the sets
-        root1: UnionFindNode = self.find(data1)
-        root2: UnionFindNode = self.find(data2)
+        root1: int = self.find(data1)
+        root2: int = self.find(data2)
         if root1 == root2:
-            return
-        if root1.size > root2.size:
-            setattr(root2, 'parent', root1)
-            setattr(root1, 'size', root1.size + root2.size)
+            return False
+        if self._size[root1] > self._size[root2]:
+            self._parent[root2] = root1
+            self._size[root1] += self._size[root2]
         else:
-            setattr(root1, 'parent', root2)
-            setattr(root2, 'size', root2.size + root1.size)
+            self._parent[root1] = root2
+            self._size[root2] += self._size[root1]
+        return True
+
+    def reset(self) -> None:
+        size: int = len(self._parent)
+        self._parent[:] = array('i', range(size))
+        self._size[:] = array('i', [1]) * size
 
     def to_string(self) -> None:
-        for key, item in self._map.items():
+        for key, item in enumerate(self._parent):
             print(f'Node: {key}, Parent {item}')
@@ -56,11 +56,12 @@ def cheapest_insertion(graph: Graph):
 
         # For all the nodes not in the circuit
         for id_new_node in remaining_nodes:
+            # The distances from the new node (they are symmetric), a single row also when the graph is lazy
+            new_node_weights = graph.weights[id_new_node - 1]
             # For all the possible combinations of edges in the partial circuit
             for id_i, id_j, weight in circuit:
                 # Calculate the cost of adding the new_node in the partial circuit
-                candidate_weight: int = graph.get_weight(id_i, id_new_node) + \
-                                        graph.get_weight(id_new_node, id_j) - weight
+                candidate_weight: int = new_node_weights[id_i - 1] + new_node_weights[id_j - 1] - weight
                 # If this cost is less of the previous one, save it and save the node and his predecessor
                 if candidate_weight < min_weight:
                     min_weight = candidate_weight
@@ -1,9 +1,7 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterable, Iterator
 
-import numpy as np
-
-from graph import Graph
+from graph import Graph, Weights
 from node import Node
 
 
@@ -73,7 +71,7 @@ class Circuit:
         """
         return node_id in self.circuit_nodes
 
-    def append(self, node: Node, weights: np.array):
+    def append(self, node: Node, weights: Weights):
         """
         Add a new node at the end of the circuit
 
@@ -81,8 +79,8 @@ class Circuit:
         ----------
         node: Node
             node to add
-        weights: np.array
-            weights of the graph
+        weights: Weights
+            weights of the graph (the matrix, a PackedMatrix or a DistanceOracle)
         """
 
         # we don't allow the same node two consecutive times in this method
@@ -90,7 +88,7 @@ class Circuit:
             return
 
         # since we add a node after the end_node, the next node must be the start_node
-        new_node = CircuitNode(node.id, self.start_node, weights[node.id - 1, self.start_node.id - 1])
+        new_node = CircuitNode(node.id, self.start_node, int(weights[node.id - 1, self.start_node.id - 1]))
 
         # add the cost to go from this node to the next ones (start_node)
         self.total_weight += new_node.next_weight
@@ -100,7 +98,7 @@ class Circuit:
 
         self.end_node.next = new_node
 
-        self.end_node.next_weight = weights[self.end_node.id - 1, new_node.id - 1]
+        self.end_node.next_weight = int(weights[self.end_node.id - 1, new_node.id - 1])
 
         # add the cost to go from the current end_node to the new ones
         self.total_weight += self.end_node.next_weight
@@ -111,7 +109,7 @@ class Circuit:
         # since we have a new end node, we must update end_node field
         self.end_node = new_node
 
-    def insert_after_node(self, from_node_id: int, to_new_node_id: int, weights: np.array):
+    def insert_after_node(self, from_node_id: int, to_new_node_id: int, weights: Weights):
         """
         Insert a new circuit after a node in the circuit
 
@@ -137,12 +135,12 @@ class Circuit:
         # Insert the new node after the given node and update next_weight and total_weight
         self.total_weight -= current_node.next_weight
         current_node.next = new_next_node
-        current_node.next_weight = weights[current_node.id - 1, new_next_node.id - 1]
+        current_node.next_weight = int(weights[current_node.id - 1, new_next_node.id - 1])
         self.total_weight += current_node.next_weight
 
         # The new node has the old next node as its own next node but with a different weight
         new_next_node.next = current_next_node
-        new_next_node.next_weight = weights[new_next_node.id - 1, current_next_node.id - 1]
+        new_next_node.next_weight = int(weights[new_next_node.id - 1, current_next_node.id - 1])
         self.total_weight += new_next_node.next_weight
 
         # Insert the new CircuitNode in the dictionary
@@ -169,7 +167,31 @@ class Circuit:
             nav = nav.next
 
     @staticmethod
-    def from_mst_preorder(mst: Graph, weights: np.array) -> 'Circuit':
+    def from_tour(tour: Iterable[int], weights: Weights) -> 'Circuit':
+        """
+        Returns a Circuit that visits the nodes in the given order
+
+        Parameters
+        ----------
+        tour: Iterable[int]
+            the ids of the nodes in the order of the circuit, starting from the start_node
+        weights: Weights
+            all the weight in the graph
+
+        Returns
+        ----------
+        Circuit
+            the circuit that visits the nodes in order and goes back to the first one
+
+        """
+        node_ids: Iterator[int] = iter(tour)
+        circuit: Circuit = Circuit(Node(next(node_ids), 0, 0))
+        for node_id in node_ids:
+            circuit.append(Node(node_id, 0, 0), weights)
+        return circuit
+
+    @staticmethod
+    def from_mst_preorder(mst: Graph, weights: Weights) -> 'Circuit':
         """
         Returns a Circuit from a MST tree using preorder visit
 
@@ -177,7 +199,7 @@ class Circuit:
         ----------
         mst: Graph
             the input MST
-        weights: np.array
+        weights: Weights
             all the weight in the original graph
 
         Returns
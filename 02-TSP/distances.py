@@ -1,5 +1,7 @@
 import math
-from typing import Final
+from typing import Final, Optional
+
+import numpy as np
 
 RRR: Final = 6378.388
 
@@ -79,3 +81,125 @@ def get_distance_euclidean(x_1: float, y_1: float, x_2: float, y_2: float) -> in
         the euclidean distance between the two nodes
     """
     return round(math.sqrt(((x_1 - x_2) ** 2) + ((y_1 - y_2) ** 2)))
+
+
+def _coordinates_to_radians(coordinates: np.ndarray) -> np.ndarray:
+    # like _coordinate_to_radian, on all the coordinates at once
+    degrees: np.ndarray = np.trunc(coordinates)
+    minutes: np.ndarray = coordinates - degrees
+    return np.radians(degrees + minutes * 5 / 3)
+
+
+def get_distance_matrix_geographic(latitudes: np.ndarray, longitudes: np.ndarray,
+                                   rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Given the coordinates of all the nodes, the function returns the matrix of the geographic
+    distances between every pair of nodes, with the same rounding of get_distance_geographic
+
+    Parameters:
+    -----------
+    latitudes: np.ndarray
+        the latitude of each node
+    longitudes: np.ndarray
+        the longitude of each node
+    rows: Optional[np.ndarray]
+        the indexes of the nodes to calculate the distances from, all of them if None
+
+    Returns:
+    --------
+    np.ndarray
+        the len(rows) x n matrix of the distances, with zeros for the distance of a node from itself
+    """
+    rows = np.arange(len(latitudes)) if rows is None else np.asarray(rows)
+    latitudes = _coordinates_to_radians(latitudes)
+    longitudes = _coordinates_to_radians(longitudes)
+
+    # every pair at once: a column of the first nodes against a row of the second ones
+    q1: np.ndarray = np.cos(longitudes[rows, None] - longitudes[None, :])
+    q2: np.ndarray = np.cos(latitudes[rows, None] - latitudes[None, :])
+    q3: np.ndarray = np.cos(latitudes[rows, None] + latitudes[None, :])
+
+    # the rounding errors can take the argument just outside [-1, 1] for very close nodes
+    cosine: np.ndarray = np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)
+    distances: np.ndarray = np.trunc(RRR * np.arccos(cosine) + 1)
+    distances[np.arange(len(rows)), rows] = 0
+    return distances
+
+
+def get_distance_matrix_euclidean(xs: np.ndarray, ys: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Given the coordinates of all the nodes, the function returns the matrix of the euclidean
+    distances between every pair of nodes, with the same rounding of get_distance_euclidean
+
+    Parameters:
+    -----------
+    xs: np.ndarray
+        the abscissa coordinate of each node
+    ys: np.ndarray
+        the ordinate coordinate of each node
+    rows: Optional[np.ndarray]
+        the indexes of the nodes to calculate the distances from, all of them if None
+
+    Returns:
+    --------
+    np.ndarray
+        the len(rows) x n matrix of the distances, with zeros for the distance of a node from itself
+    """
+    rows = np.arange(len(xs)) if rows is None else np.asarray(rows)
+    # np.rint rounds half to even like round
+    return np.rint(np.sqrt((xs[rows, None] - xs[None, :]) ** 2 + (ys[rows, None] - ys[None, :]) ** 2))
+
+
+def get_distance_rows(weight_type: str, xs: np.ndarray, ys: np.ndarray,
+                      rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Given the coordinates of all the nodes, the function returns the distances from the nodes
+    in rows to all the nodes, calculated based on the weight type
+
+    Parameters:
+    -----------
+    weight_type: str
+        how to calculate the distance (EUC_2D or GEO), all the distances are 0 for the other types
+    xs: np.ndarray
+        the first coordinate of each node
+    ys: np.ndarray
+        the second coordinate of each node
+    rows: Optional[np.ndarray]
+        the indexes of the nodes to calculate the distances from, all of them if None
+
+    Returns:
+    --------
+    np.ndarray
+        the len(rows) x n matrix of the distances
+    """
+    if weight_type == "EUC_2D":
+        return get_distance_matrix_euclidean(xs, ys, rows)
+    if weight_type == "GEO":
+        return get_distance_matrix_geographic(xs, ys, rows)
+    return np.zeros((len(xs) if rows is None else len(rows), len(xs)))
+
+
+def get_max_distance(weight_type: str, xs: np.ndarray, ys: np.ndarray) -> int:
+    """
+    Returns an upper bound of the distance between any two nodes, without calculating them:
+    the diagonal of the box around the nodes for EUC_2D, half of the earth for GEO
+
+    Parameters:
+    -----------
+    weight_type: str
+        how to calculate the distance (EUC_2D or GEO)
+    xs: np.ndarray
+        the first coordinate of each node
+    ys: np.ndarray
+        the second coordinate of each node
+
+    Returns:
+    --------
+    int
+        the upper bound
+    """
+    if weight_type == "EUC_2D" and len(xs) > 0:
+        return round(math.hypot(np.ptp(xs), np.ptp(ys))) + 1
+    if weight_type == "GEO":
+        return int(RRR * math.pi + 1)
+    return 0
@@ -3,7 +3,7 @@ import os
 import time
 from collections import defaultdict, OrderedDict
 from dataclasses import dataclass
-from typing import Callable, List, Dict, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 
 from tabulate import tabulate
 
@@ -11,6 +11,8 @@ from circuit import Circuit
 from graph import Graph, graph_from_file
 import matplotlib.pyplot as plt
 
+from memory import MemoryUsage, measure_memory
+
 from random_insertion import random_insertion
 
 TSPAlgorithm = Callable[[Graph], Circuit]
@@ -41,24 +43,50 @@ class Evaluation:
     optimal_result: float
     error: float
     run_time: int
+    # memory used to load the graph and by a run of the algorithm, if measured
+    construction_memory: Optional[MemoryUsage]
+    run_memory: Optional[MemoryUsage]
 
-    def __init__(self, name, n: int, result, optimal_result, run_time: int):
+    def __init__(self, name, n: int, result, optimal_result, run_time: int,
+                 construction_memory: Optional[MemoryUsage] = None, run_memory: Optional[MemoryUsage] = None):
         self.name = name
         self.n = n
         self.result = result
         self.optimal_result = optimal_result
         self.run_time = run_time
         self.error = (result - optimal_result) / optimal_result
+        self.construction_memory = construction_memory
+        self.run_memory = run_memory
+
 
+def evaluate(algorithm: TSPAlgorithm, repetitions=200, memory: bool = False, lazy: bool = False,
+             packed: bool = False):
+    """
+    Evaluates the algorithm on all the dataset, if memory is True it also measures the memory
+    used to load every graph and by one more (not timed) run of the algorithm; the matrices are
+    then always calculated, since memory-mapping them from the cache would not be measured.
+    If lazy is True the graphs don't store the distance matrix (see DistanceOracle),
+    if packed is True they store only its upper triangle (see PackedMatrix)
 
-def evaluate(algorithm: TSPAlgorithm, repetitions=200):
-    file_names: List[str] = os.listdir("dataset")
+    """
+    file_names: List[str] = __dataset_files()
     evaluations: List[Evaluation] = []
 
     for index, file_name in enumerate(file_names):
-        graph = graph_from_file("dataset/" + file_name)
+        construction_memory: Optional[MemoryUsage] = None
+        if memory:
+            with measure_memory() as construction_memory:
+                graph = graph_from_file("dataset/" + file_name, lazy, packed, use_cache=False)
+        else:
+            graph = graph_from_file("dataset/" + file_name, lazy, packed)
         print("Loading %s (%d/%d)" % (file_name, index + 1, len(file_names)))
-        evaluations.append(__evaluate_on_dataset(algorithm, graph, repetitions))
+
+        evaluation = __evaluate_on_dataset(algorithm, graph, repetitions)
+        if memory:
+            with measure_memory() as evaluation.run_memory:
+                algorithm(graph)
+            evaluation.construction_memory = construction_memory
+        evaluations.append(evaluation)
 
     print("DONE\n")
     return evaluations
@@ -159,6 +187,12 @@ def make_plots(random_evaluations: List[Evaluation], cheapest_evaluations: List[
 
 def pretty_print(evaluations: List[Evaluation], approximation_function: ApproximationFunction, name: str):
     data = []
+    headers = ["Name", "Result", "Optimal Result", "Error (%)", "Approx compliant", "Time (ns)"]
+
+    # the memory columns only if it has been measured
+    with_memory = any(evaluation.run_memory is not None for evaluation in evaluations)
+    if with_memory:
+        headers += ["Construction peak (B)", "Run peak (B)", "Peak RSS (B)"]
 
     with open("result/" + name + ".txt", "w") as f:
 
@@ -167,10 +201,14 @@ def pretty_print(evaluations: List[Evaluation], approximation_function: Approxim
         for evaluation in evaluations:
             approx_factor = evaluation.optimal_result * approximation_function(evaluation.n)
             approx_compliant = "YES" if ((evaluation.result / evaluation.optimal_result) <= approx_factor) else "NO"
-            data.append([evaluation.name, evaluation.result, evaluation.optimal_result, evaluation.error * 100,
-                         approx_compliant, evaluation.run_time])
+            row = [evaluation.name, evaluation.result, evaluation.optimal_result, evaluation.error * 100,
+                   approx_compliant, evaluation.run_time]
+            if with_memory:
+                row += [evaluation.construction_memory.traced_peak, evaluation.run_memory.traced_peak,
+                        evaluation.run_memory.rss_peak]
+            data.append(row)
 
-        f.write(tabulate(data, headers=["Name", "Result", "Optimal Result", "Error (%)", "Approx compliant", "Time (ns)"]))
+        f.write(tabulate(data, headers=headers))
 
 
 def __evaluate_on_dataset(algorithm: TSPAlgorithm, graph: Graph, repetitions=200) -> Evaluation:
@@ -188,12 +226,17 @@ def __evaluate_on_dataset(algorithm: TSPAlgorithm, graph: Graph, repetitions=200
                       round((end_time - start_time) / repetitions))
 
 
+def __dataset_files() -> List[str]:
+    # only the instances, not the caches of their matrices
+    return [file_name for file_name in os.listdir("dataset") if file_name.endswith(".tsp")]
+
+
 def __get_optimal_result(graph_name: str):
     return __optimal_results.get(graph_name) or __optimal_results.get(graph_name[:-4])
 
 
 def random_best_evaluation(repetitions: int, single_evaluation: List[Evaluation]):
-    file_names: List[str] = os.listdir("dataset")
+    file_names: List[str] = __dataset_files()
     evaluations: Dict[str, Tuple[Evaluation, int]] = {}
 
     for index, file_name in enumerate(file_names):
@@ -1,12 +1,40 @@
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+from distance_oracle import DEFAULT_CACHE_ROWS, DistanceOracle
 from node import Node
-from parser import parse, Content
+from packed_matrix import PackedMatrix
+from parser import parse, Content, file_digest, read_matrix_cache, write_matrix_cache
 import distances as dst
 import numpy as np
 
 Edges = Dict[Tuple[int, int], int]
+# The whole matrix, or the oracle that calculates its rows when needed
+Weights = Union[np.ndarray, PackedMatrix, DistanceOracle]
+
+# Number of distances calculated at once when building the matrix, so the float temporaries stay small
+BLOCK_SIZE = 1 << 20
+
+
+def weights_dtype(max_weight: int) -> np.dtype:
+    """
+    Returns the smallest signed integer type for the weights of a graph, such that also
+    the sum of two weights fits (the insertion heuristics add two weights and subtract one)
+
+    Parameters
+    ----------
+    max_weight: int
+        the maximum weight of the graph
+
+    Returns
+    -------
+    np.dtype
+        int16, int32 or int64
+    """
+    for dtype in (np.int16, np.int32):
+        if 2 * max_weight <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
 
 
 @dataclass
@@ -24,8 +52,19 @@ class Graph:
         the type of representation of the nodes. Useful to know how to calculate distance between nodes
     nodes: Dict[int, Node]
         a list to store all the nodes present in the graph
-    weights: np.ndarray
-        a matrix to store all the weight for go from one node to another one in the graph
+    weights: Weights
+        a matrix to store all the weight for go from one node to another one in the graph,
+        of the smallest integer type that fits the distances. With packed it is a PackedMatrix,
+        with lazy a DistanceOracle, both indexed in the same way
+    lazy: bool
+        if the distances are calculated on demand instead of stored in a matrix
+    cache_rows: int
+        with lazy, how many rows of the matrix the oracle keeps
+    packed: bool
+        if only the upper triangle of the matrix is stored
+    precomputed: bool
+        if the weights have been given when the graph was created (e.g. from the cache),
+        so they are not calculated when the graph is complete
     """
     name: str
     n: int
@@ -33,37 +72,28 @@ class Graph:
     # Store all the nodes to access more quickly
     nodes: Dict[int, Node]
     # Store the weights of alle the edges in a matrix
-    weights: np.ndarray
-
-    def __init__(self, name: str, n: int, weight_type: str) -> None:
+    weights: Weights
+    lazy: bool
+    cache_rows: int
+    packed: bool
+    precomputed: bool
+
+    def __init__(self, name: str, n: int, weight_type: str, lazy: bool = False,
+                 cache_rows: int = DEFAULT_CACHE_ROWS, packed: bool = False,
+                 weights: Optional[Weights] = None) -> None:
         self.name = name
         self.n = n
         self.weight_type = weight_type
         self.nodes = {}
-        self.weights = np.zeros((n, n))
-
-    def _get_distance(self, first: Node, second: Node) -> int:
-        """
-        Given two nodes, the function returns the distance calculate baesd on
-        the variable "weight_type" of the graph
-
-        Attributes:
-        -----------
-        first: Node
-            node from calculate the distance
-        second: Node
-            node to calculate the distance
-
-        Returns:
-        int
-            the distance between two nodes
-        """
-        distance: int = 0
-        if self.weight_type == "EUC_2D":
-            distance = dst.get_distance_euclidean(first.x, first.y, second.x, second.y)
-        elif self.weight_type == "GEO":
-            distance = dst.get_distance_geographic(first.x, first.y, second.x, second.y)
-        return distance
+        self.lazy = lazy
+        self.cache_rows = cache_rows
+        self.packed = packed
+        self.precomputed = weights is not None
+        if self.precomputed:
+            self.weights = weights
+        else:
+            # with lazy, the oracle is created when the graph is complete
+            self.weights = None if lazy else np.zeros((n, n))
 
     def add_node(self, i: int, x: float, y: float) -> None:
         """
@@ -80,7 +110,7 @@ class Graph:
         """
         # Insert new node in the list of all nodes in the graph
         self.nodes[i] = Node(i, x, y)
-        if len(self.nodes) == self.n:
+        if len(self.nodes) == self.n and not self.precomputed:
             self._calculate_weights()
 
     def get_nodes(self) -> List[Node]:
@@ -95,27 +125,48 @@ class Graph:
         return list(self.nodes.values())
 
     def adj_nodes(self, node_id: int):
-        for node in self.get_nodes():
+        for node in self.nodes.values():
             if node.id != node_id:
                 yield node
 
     def node_weights(self, node_id: int):
-        for node in self.get_nodes():
+        row: np.ndarray = self.weights[node_id - 1]
+        for node in self.nodes.values():
             if node.id != node_id:
-                yield node, self.weights[node_id - 1, node.id - 1]
+                yield node, row[node.id - 1]
 
     def _calculate_weights(self) -> None:
         """
         Calculate all the distance in the nodes inside the graph.
         MUST BE USE ONLY WHEN THE GRAPH IS COMPLETE.
         """
-        # Considering every node in the graph
+        # The coordinates of the nodes in two arrays
+        # Indexes start from 0, but nodes start from 1
+        xs: np.ndarray = np.zeros(self.n)
+        ys: np.ndarray = np.zeros(self.n)
         for node in self.nodes.values():
-            # and considering all the other nodes
-            for adj_node in self.adj_nodes(node.id):
-                # Calculate the distance between the nodes and store the result in the matrix
-                # Indexes start from 0, but nodes start from 1
-                self.weights[node.id - 1, adj_node.id - 1] = self._get_distance(node, adj_node)
+            xs[node.id - 1] = node.x
+            ys[node.id - 1] = node.y
+
+        # The distances are rounded integers, bounded by the distance of the farthest coordinates
+        dtype: np.dtype = weights_dtype(dst.get_max_distance(self.weight_type, xs, ys))
+
+        if self.lazy:
+            # Only the coordinates, the distances are calculated when asked
+            self.weights = DistanceOracle(xs, ys, self.weight_type, self.cache_rows, dtype)
+            return
+
+        self.weights = PackedMatrix(self.n, dtype) if self.packed else np.zeros((self.n, self.n), dtype=dtype)
+
+        block: int = max(BLOCK_SIZE // max(self.n, 1), 1)
+        for start in range(0, self.n, block):
+            rows: np.ndarray = np.arange(start, min(start + block, self.n))
+            distances: np.ndarray = dst.get_distance_rows(self.weight_type, xs, ys, rows)
+            if self.packed:
+                for i, row in zip(rows, distances):
+                    self.weights.set_row(i, row)
+            else:
+                self.weights[rows] = distances
 
     def get_weight(self, first_node_id: int, second_node_id: int) -> int:
         """
@@ -133,7 +184,7 @@ class Graph:
         int:
             the weight of the traverselling
         """
-        return self.weights[first_node_id - 1][second_node_id - 1]
+        return self.weights[first_node_id - 1, second_node_id - 1]
 
     def print(self) -> None:
         """
@@ -181,7 +232,7 @@ class Graph:
         self.weights[node2 - 1, node1 - 1] = weight
 
 
-def graph_from_file(path: str) -> Graph:
+def graph_from_file(path: str, lazy: bool = False, packed: bool = False, use_cache: bool = True) -> Graph:
     """
     Given the path to a ".tsp" file, the funtion return the corresponding graph
 
@@ -189,6 +240,14 @@ def graph_from_file(path: str) -> Graph:
     -----------
     path: str
         the path to the file which contains the information of the graph
+    lazy: bool
+        if True the graph stores only the coordinates and calculates the distances when
+        needed (see DistanceOracle), so the memory is O(n) instead of O(n^2)
+    packed: bool
+        if True only the upper triangle of the matrix is stored (see PackedMatrix)
+    use_cache: bool
+        if True the matrix is memory-mapped (read only) from the ".npy" cache next to the file,
+        written the first time, so only the first load calculates the distances
 
     Returns:
     --------
@@ -196,7 +255,26 @@ def graph_from_file(path: str) -> Graph:
         the corresponding graph
     """
     content: Content = parse(path)
-    graph: Graph = Graph(content.name, content.n, content.weight_type)
+    # the oracle doesn't store the matrix, so there is nothing to cache
+    use_cache = use_cache and not lazy
+
+    weights: Optional[Weights] = None
+    if use_cache:
+        # hashed once for both the read and the write of the cache
+        digest: str = file_digest(path)
+        cached: Optional[np.ndarray] = read_matrix_cache(path, digest, content.weight_type, packed)
+        if cached is not None:
+            weights = PackedMatrix(content.n, cached.dtype, cached) if packed else cached
+
+    graph: Graph = Graph(content.name, content.n, content.weight_type, lazy, packed=packed, weights=weights)
     for i, x, y in content.triples:
         graph.add_node(i, x, y)
+
+    if use_cache and weights is None:
+        try:
+            write_matrix_cache(path, digest, content.weight_type, graph.weights.values if packed else graph.weights,
+                               packed)
+        except OSError:
+            # the cache is only an optimization, a read-only dataset still works
+            pass
     return graph
@@ -30,13 +30,23 @@ def main():
         evaluator.random_best_evaluation(1000, random_evaluation)
         return
 
-    random_evaluation = evaluator.evaluate(random_insertion)
+    # measure also the memory used to load the graphs and by the algorithms with:
+    # python3 main.py --memory
+    memory = "--memory" in sys.argv
+    # calculate the distances on demand instead of storing the whole matrices with:
+    # python3 main.py --lazy
+    lazy = "--lazy" in sys.argv
+    # or store only the upper triangle of the matrices with:
+    # python3 main.py --packed
+    packed = "--packed" in sys.argv
+
+    random_evaluation = evaluator.evaluate(random_insertion, memory=memory, lazy=lazy, packed=packed)
     evaluator.pretty_print(random_evaluation, logn_function, "random")
 
-    cheapest_evaluation = evaluator.evaluate(cheapest_insertion)
+    cheapest_evaluation = evaluator.evaluate(cheapest_insertion, memory=memory, lazy=lazy, packed=packed)
     evaluator.pretty_print(cheapest_evaluation, two_approx_function, "cheapest")
 
-    two_approx_evaluation = evaluator.evaluate(approx_metric_tsp)
+    two_approx_evaluation = evaluator.evaluate(approx_metric_tsp, memory=memory, lazy=lazy, packed=packed)
     evaluator.pretty_print(two_approx_evaluation, two_approx_function, "2_approx")
 
     evaluator.make_plots(random_evaluation, cheapest_evaluation, two_approx_evaluation)
@@ -0,0 +1,82 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+
+class PackedMatrix:
+    """
+    Class for represent a symmetric matrix storing only its upper triangle (diagonal included)
+    in a single array, row after row: about half of the memory of the whole matrix.
+
+    It is indexed like the matrix (indexes start from 0): matrix[i, j] is an entry and
+    matrix[i] a whole row, that is gathered from the triangle.
+
+    n : int
+        number of rows (and columns) of the matrix
+    offsets : np.ndarray
+        position in values of the entry (i, i) of each row
+    values : np.ndarray
+        the entries (i, j) with i <= j
+    """
+
+    def __init__(self, n: int, dtype: np.dtype = np.float64, values: Optional[np.ndarray] = None):
+        self.n = n
+        rows: np.ndarray = np.arange(n, dtype=np.int64)
+        # row i starts after the n - k entries of every row k before it
+        self.offsets: np.ndarray = rows * n - rows * (rows - 1) // 2
+        # the given values are used as they are, e.g. memory-mapped from the cache
+        self.values: np.ndarray = np.zeros(n * (n + 1) // 2, dtype=dtype) if values is None else values
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.n, self.n
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    def _index(self, i: int, j: int) -> int:
+        if i > j:
+            i, j = j, i
+        return self.offsets[i] + j - i
+
+    def set_row(self, i: int, row: np.ndarray) -> None:
+        """
+        Set a whole row of the matrix, only the entries from the diagonal on are stored
+
+        Parameters
+        ----------
+        i: int
+            index of the row
+        row: np.ndarray
+            the n entries of the row
+        """
+        start: int = self.offsets[i]
+        self.values[start:start + self.n - i] = row[i:]
+
+    def row(self, i: int) -> np.ndarray:
+        """
+        Returns a copy of the row i of the matrix
+
+        Parameters
+        ----------
+        i: int
+            index of the row
+
+        Returns
+        -------
+        np.ndarray
+            the n entries of the row
+        """
+        # the entries before the diagonal are in the column i of the rows before
+        before: np.ndarray = self.values[self.offsets[:i] + i - np.arange(i)]
+        start: int = self.offsets[i]
+        return np.concatenate((before, self.values[start:start + self.n - i]))
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]) -> Union[np.ndarray, int]:
+        if not isinstance(index, tuple):
+            return self.row(index)
+        return self.values[self._index(*index)]
+
+    def __setitem__(self, index: Tuple[int, int], value: int) -> None:
+        self.values[self._index(*index)] = value
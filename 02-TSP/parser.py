@@ -1,5 +1,14 @@
+import glob
+import hashlib
+import os
+import re
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Bump when the way the distances are calculated or stored changes, so the old caches are ignored
+MATRIX_CACHE_VERSION = 1
 
 
 @dataclass
@@ -62,3 +71,116 @@ def parse(path: str) -> Content:
     # Close the file
     file.close()
     return content
+
+
+def file_digest(path: str) -> str:
+    """
+    Returns the hash of the content of a file, computed once by the caller of the functions
+    of the matrix cache
+
+    Parameters
+    ----------
+    path: str
+        the path to the file
+
+    Returns
+    -------
+    str
+        the first 16 hexadecimal digits of the SHA-256 of the file
+    """
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()[:16]
+
+
+def matrix_cache_path(path: str, digest: str, weight_type: str, packed: bool = False) -> str:
+    """
+    Returns the path of the cache of the distance matrix of a ".tsp" file, next to the file itself.
+    The name contains the hash of the content of the file and the metric, so a changed file
+    or a different metric never reads an old matrix
+
+    Parameters
+    ----------
+    path: str
+        the path to the ".tsp" file
+    digest: str
+        the hash of the ".tsp" file, as returned by file_digest
+    weight_type: str
+        the metric of the distances (EUC_2D or GEO)
+    packed: bool
+        if the cache is of the packed upper triangle instead of the whole matrix
+
+    Returns
+    -------
+    str
+        the path of the cache
+    """
+    layout: str = "packed" if packed else "full"
+    return "%s.%s.%s.%s.v%d.npy" % (os.path.splitext(path)[0], digest, weight_type, layout, MATRIX_CACHE_VERSION)
+
+
+def read_matrix_cache(path: str, digest: str, weight_type: str, packed: bool = False) -> Optional[np.ndarray]:
+    """
+    Memory-map the cached distance matrix of a ".tsp" file (read only), if it exists
+
+    Parameters
+    ----------
+    path: str
+        the path to the ".tsp" file
+    digest: str
+        the hash of the ".tsp" file, as returned by file_digest
+    weight_type: str
+        the metric of the distances (EUC_2D or GEO)
+    packed: bool
+        if the cache is of the packed upper triangle instead of the whole matrix
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        the matrix (or the packed triangle), None if there is no valid cache
+    """
+    try:
+        matrix = np.load(matrix_cache_path(path, digest, weight_type, packed), mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    # a plain ndarray on the same memory: indexing an np.memmap goes through Python code every time
+    return matrix.view(np.ndarray)
+
+
+def write_matrix_cache(path: str, digest: str, weight_type: str, matrix: np.ndarray, packed: bool = False) -> None:
+    """
+    Write the distance matrix of a ".tsp" file in its cache, and delete the caches of the same
+    layout left by older versions of the file or of the cache
+
+    Parameters
+    ----------
+    path: str
+        the path to the ".tsp" file
+    digest: str
+        the hash of the ".tsp" file, as returned by file_digest
+    weight_type: str
+        the metric of the distances (EUC_2D or GEO)
+    matrix: np.ndarray
+        the matrix (or the packed triangle) to write
+    packed: bool
+        if the matrix is the packed upper triangle instead of the whole matrix
+    """
+    cache_path: str = matrix_cache_path(path, digest, weight_type, packed)
+
+    # write on a temporary file and then rename it, so a reader never sees a partial cache
+    temporary_path: str = cache_path + "." + str(os.getpid()) + ".tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            np.save(file, matrix)
+        os.replace(temporary_path, cache_path)
+    finally:
+        # after a failed write or rename the temporary file must not be left behind
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+    # the siblings with another digest, metric or version can't be read anymore
+    base: str = os.path.splitext(path)[0]
+    layout: str = "packed" if packed else "full"
+    stale_name = re.compile(r"\.[0-9a-f]{16}\.\w+\.%s\.v\d+\.npy" % layout)
+    for sibling in glob.glob(glob.escape(base) + ".*.npy"):
+        if sibling != cache_path and stale_name.fullmatch(sibling[len(base):]):
+            os.remove(sibling)
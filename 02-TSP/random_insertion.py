@@ -1,12 +1,18 @@
 import random
 
+import numpy as np
+
 from circuit import Circuit
 from graph import Graph
 
 
 def random_insertion(graph: Graph) -> Circuit:
     """
-    Returns a Circuit created using Random Insertion on the input graph
+    Returns a Circuit created using Random Insertion on the input graph.
+    The partial circuit is kept in arrays (the nodes in order and the weight of the edge
+    from each one to the next), so the insertion cost of a node on every edge is
+    calculated in one vectorized expression
+
     Parameters
     ----------
     graph : Graph
@@ -19,7 +25,6 @@ def random_insertion(graph: Graph) -> Circuit:
     """
     #  -------- INITIALIZATION --------
     node_0 = graph.nodes[1]
-    circuit = Circuit(node_0)
 
     min_node = None
     min_weight = None
@@ -30,8 +35,14 @@ def random_insertion(graph: Graph) -> Circuit:
             min_weight = weight
             min_node = node
 
-    # add it to the circuit
-    circuit.append(min_node, graph.weights)
+    # the circuit node_0 -> min_node -> node_0, as indexes of the matrix (ids start from 1)
+    tour: np.ndarray = np.zeros(graph.n, dtype=np.int64)
+    tour[0], tour[1] = node_0.id - 1, min_node.id - 1
+    # the weight of the edge from tour[i] to the next node (the last one goes back to the first)
+    next_weights: np.ndarray = np.zeros(graph.n, dtype=np.int64)
+    next_weights[0] = graph.weights[node_0.id - 1, min_node.id - 1]
+    next_weights[1] = graph.weights[min_node.id - 1, node_0.id - 1]
+    size: int = 2
 
     # a list of all nodes except node_0 and its nearest node
     remaining_nodes = [node_id for node_id in list(graph.nodes.keys())
@@ -41,27 +52,26 @@ def random_insertion(graph: Graph) -> Circuit:
     random.shuffle(remaining_nodes)
 
     #  -------- SELECTION --------
-    for node_index in range(len(remaining_nodes)):
+    for random_node_id in remaining_nodes:
         # this is equal to a random choice thanks to the random shuffle
-        random_node_id = remaining_nodes[node_index]
-
-        min_delta = None
-        min_node_id = 0
-        for node_id, next_node_id, weight in circuit:
-            # we have i and j and I want add a node k between them
-            # candidate_weight = w(i, k) + w(k, j)
-            candidate_weight = graph.weights[random_node_id - 1, node_id - 1] \
-                               + graph.weights[random_node_id - 1, next_node_id - 1]
+        random_node_weights = graph.weights[random_node_id - 1]
 
-            # delta is the insertion cost
-            delta = candidate_weight - weight
+        # we have every i and its j and I want add a node k between them
+        # delta = w(k, i) + w(k, j) - w(i, j) for all the edges at once
+        to_nodes: np.ndarray = random_node_weights[tour[:size]].astype(np.int64)
+        to_next_nodes: np.ndarray = np.roll(to_nodes, -1)
+        deltas: np.ndarray = to_nodes + to_next_nodes - next_weights[:size]
 
-            if min_delta is None or delta < min_delta:
-                # considering the min delta
-                min_delta = delta
-                min_node_id = node_id
+        # argmin returns the first minimum, as the scan of the circuit from node_0
+        position: int = int(np.argmin(deltas))
 
         #  -------- INSERTION --------
-        circuit.insert_after_node(min_node_id, random_node_id, graph.weights)
+        # shift the nodes after i to make room for k (numpy handles the overlap)
+        tour[position + 2:size + 1] = tour[position + 1:size]
+        next_weights[position + 2:size + 1] = next_weights[position + 1:size]
+        tour[position + 1] = random_node_id - 1
+        next_weights[position] = to_nodes[position]
+        next_weights[position + 1] = to_next_nodes[position]
+        size += 1
 
-    return circuit
+    return Circuit.from_tour((tour[:size] + 1).tolist(), graph.weights)
@@ -1,12 +1,13 @@
 import copy
 import gc
 import random
+import sys
 from collections import defaultdict
 from sys import maxsize
 from os import listdir
 from time import perf_counter_ns
 from math import log2
-from typing import Callable, List, Dict
+from typing import Callable, List, Dict, Optional
 from dataclasses import dataclass, field
 
 import matplotlib.pyplot as plt
@@ -15,8 +16,10 @@ from tabulate import tabulate
 from algorithms.stoer_wagner import global_min_cut
 from graph import Graph, graph_from_file
 from algorithms.karger_stein import recursive_contract
+from memory import MemoryUsage, measure_memory
 
-DATASET: List[str] = sorted(listdir("dataset"))
+# only the source files, not their binary caches
+DATASET: List[str] = sorted(file for file in listdir("dataset") if file.endswith(".txt"))
 
 # Type alias
 Time = float  # Union[int, float]
@@ -45,15 +48,20 @@ class Analysis:
     execution_time: int = field(default=maxsize)
     # Useful for Karger & Stein's analysis
     discovery_time: int = field(default=maxsize, init=False)
+    # Memory used to load the graph and by a run of the algorithm, if measured
+    construction_memory: Optional[MemoryUsage] = field(default=None)
+    run_memory: Optional[MemoryUsage] = field(default=None)
 
 
-def measure_stoer_wagner_algorithm(name: str, g: Graph) -> Analysis:
+def measure_stoer_wagner_algorithm(name: str, g: Graph, memory: bool = False) -> Analysis:
     """
 
     Parameters:
     -----------
     g: Graph
         is the graph where to execute the algorithm.
+    memory: bool
+        if True, measure also the memory used by one more (not timed) execution
 
     Returns:
     --------
@@ -79,10 +87,15 @@ def measure_stoer_wagner_algorithm(name: str, g: Graph) -> Analysis:
     # Elaborate total execution time
     result.minimum_cost = min_cut
     result.execution_time = (end_execution_timer - start_execution_timer) / iterations
+
+    if memory:
+        graph_clone = copy.deepcopy(g)
+        with measure_memory() as result.run_memory:
+            global_min_cut(graph_clone)
     return result
 
 
-def measure_karger_stein_algorithm(name: str, g: Graph) -> Analysis:
+def measure_karger_stein_algorithm(name: str, g: Graph, memory: bool = False) -> Analysis:
     """
     Given a graph, the function executes log^2(n) the recursive_contract in order to have the error 
     probability less or equal 1/n.
@@ -92,6 +105,8 @@ def measure_karger_stein_algorithm(name: str, g: Graph) -> Analysis:
     -----------
     g: Graph
         is the graph where to execute the Karger & Stein's algorithms.
+    memory: bool
+        if True, measure also the memory used by one more (not timed) recursive_contract
 
     Returns:
     --------
@@ -126,6 +141,11 @@ def measure_karger_stein_algorithm(name: str, g: Graph) -> Analysis:
     gc.enable()
 
     result.execution_time = (end_execution_timer - start_execution_timer) / time_iterations
+
+    if memory:
+        graph_clone = copy.deepcopy(g)
+        with measure_memory() as result.run_memory:
+            recursive_contract(graph_clone)
     return result
 
 
@@ -197,6 +217,11 @@ def analysis_study(algorithm_name: str, analysis_list: List[Analysis], complexit
     if algorithm_name == "Karger_Stein":
         headers.append("Discovery time (ns)")
 
+    # the memory columns only if it has been measured
+    with_memory = any(analysis.run_memory is not None for analysis in analysis_list)
+    if with_memory:
+        headers += ["Construction peak (B)", "Run peak (B)", "Peak RSS (B)"]
+
     data = []
     constants = []
     for analysis in analysis_list:
@@ -207,6 +232,9 @@ def analysis_study(algorithm_name: str, analysis_list: List[Analysis], complexit
         result = [analysis.graph_name, analysis.minimum_cost, constant, analysis.execution_time]
         if algorithm_name == "Karger_Stein":
             result.append(analysis.discovery_time)
+        if with_memory:
+            result += [analysis.construction_memory.traced_peak, analysis.run_memory.traced_peak,
+                       analysis.run_memory.rss_peak]
 
         data.append(result)
 
@@ -327,13 +355,24 @@ def main():
     karger_stein_analysis = []
     stoer_wagner_analysis = []
 
+    # measure also the memory used to load the graphs and by the algorithms with:
+    # python3 analyzer.py --memory
+    memory: bool = "--memory" in sys.argv
+
     for file_name in DATASET:
         path: str = f"./dataset/{file_name}"
         print("Evaluation of " + file_name)
-        g: Graph = graph_from_file(path)
-
-        karger_stein_analysis.append(measure_karger_stein_algorithm(file_name, copy.deepcopy(g)))
-        stoer_wagner_analysis.append(measure_stoer_wagner_algorithm(file_name, copy.deepcopy(g)))
+        construction_memory: Optional[MemoryUsage] = None
+        if memory:
+            with measure_memory() as construction_memory:
+                g: Graph = graph_from_file(path)
+        else:
+            g = graph_from_file(path)
+
+        karger_stein_analysis.append(measure_karger_stein_algorithm(file_name, copy.deepcopy(g), memory))
+        stoer_wagner_analysis.append(measure_stoer_wagner_algorithm(file_name, copy.deepcopy(g), memory))
+        karger_stein_analysis[-1].construction_memory = construction_memory
+        stoer_wagner_analysis[-1].construction_memory = construction_memory
 
     print_comparison(karger_stein_analysis, stoer_wagner_analysis)
     ks_constant = analysis_study("Karger_Stein", karger_stein_analysis, n2logn3)
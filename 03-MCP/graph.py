@@ -113,7 +113,7 @@ class Graph:
                 yield node, weight
 
 
-def graph_from_file(path: str) -> Graph:
+def graph_from_file(path: str, bulk: bool = True, use_cache: bool = True) -> Graph:
     """
     Load the graph from a file
 
@@ -121,6 +121,12 @@ def graph_from_file(path: str) -> Graph:
     ----------
     path : str
         the relative or absolute path to the input source file
+    bulk : bool
+        if True the file is parsed in bulk as NumPy columns and the graph is built
+        with whole-array operations, otherwise it is built one edge at a time
+    use_cache : bool
+        in bulk mode, if True the edges are memory-mapped from the binary cache next
+        to the file (written on the first load), otherwise the file is always parsed
 
     Returns
     -------
@@ -128,8 +134,53 @@ def graph_from_file(path: str) -> Graph:
         the graph built based on the file content
 
     """
+    if bulk:
+        return _graph_from_columns(parser.load_columns(path, use_cache))
+
     content: parser.Content = parser.parse(path)
     graph: Graph = Graph(content.n, content.m)
     for triple in content.list_triple:
         graph.add_edge(triple[0], triple[1], triple[2])
     return graph
+
+
+def _graph_from_columns(content: parser.ColumnContent) -> Graph:
+    """
+    Build the graph from the edge columns, with the same result of calling
+    add_edge for each edge in the order of the file
+
+    Parameters
+    ----------
+    content : parser.ColumnContent
+        the columns of the edges
+
+    Returns
+    -------
+    Graph
+        the graph built based on the columns
+    """
+    graph: Graph = Graph(content.n, content.m)
+    sources: np.ndarray = content.sources
+    targets: np.ndarray = content.targets
+    weights: np.ndarray = content.weights
+
+    # add_edge overwrites the weight of an already existing edge, so for each pair
+    # of nodes only the last edge in the file is stored in the matrix
+    keys = np.minimum(sources, targets).astype(np.int64) * (graph.n + 1) + np.maximum(sources, targets)
+    _, reversed_last = np.unique(keys[::-1], return_index=True)
+    last = len(keys) - 1 - reversed_last
+    graph.weighted_matrix[sources[last], targets[last]] = weights[last]
+    graph.weighted_matrix[targets[last], sources[last]] = weights[last]
+
+    # while every edge contributes to the weighted degree of both its endpoints
+    degrees = np.bincount(sources, weights=weights, minlength=graph.n + 1) + \
+        np.bincount(targets, weights=weights, minlength=graph.n + 1)
+    degrees = np.rint(degrees).astype(np.int64)
+
+    # keep the insertion order of add_edge: nodes in order of first appearance
+    endpoints = np.column_stack((sources, targets)).ravel()
+    appearing, first = np.unique(endpoints, return_index=True)
+    ordered_nodes = appearing[np.argsort(first)]
+    graph.weighted_degree = defaultdict(int, zip(ordered_nodes.tolist(), degrees[ordered_nodes].tolist()))
+
+    return graph
@@ -0,0 +1,92 @@
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+@dataclass
+class MemoryUsage:
+    """
+    A class for represent the memory used by a block of code
+
+    Attributes
+    __________
+    rss_peak : Optional[int]
+        peak resident set size of the process during the block (bytes), None if the
+        platform doesn't provide it. Where the peak can't be reset (not Linux) it is
+        the peak since the process started
+    traced_peak : int
+        peak of the memory allocated by Python (and numpy) during the block, from tracemalloc (bytes)
+    """
+    rss_peak: Optional[int] = None
+    traced_peak: int = 0
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Returns the peak resident set size of the process in bytes, None if not available
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _reset_peak_rss() -> None:
+    # on Linux writing 5 in clear_refs resets the peak to the current resident set size
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+@contextmanager
+def measure_memory() -> Iterator[MemoryUsage]:
+    """
+    Measure the memory used by the block, e.g.:
+
+        with measure_memory() as usage:
+            graph = graph_from_file(path)
+        print(usage.traced_peak)
+
+    tracemalloc slows down the code a lot, so the block must not be the one that is timed.
+
+    Returns
+    -------
+    Iterator[MemoryUsage]
+        the usage, filled when the block ends
+    """
+    usage: MemoryUsage = MemoryUsage()
+    _reset_peak_rss()
+
+    # inside another measure only the peak is reset, and the memory already allocated is subtracted
+    tracing: bool = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    allocated, _ = tracemalloc.get_traced_memory()
+    try:
+        yield usage
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        usage.traced_peak = peak - allocated
+        if not tracing:
+            tracemalloc.stop()
+        usage.rss_peak = peak_rss()